@@ -8,17 +8,48 @@ Module pour :
 - Générer résumé final
 """
 
+import sys
+
 from .recognizer import ChecklistRecognizer
 from .validator import Validator
 
 
+# Séparateur des écrans (construit une fois)
+_SEP = "=" * 60
+
+# Composants partagés entre managers (voir ChecklistManager.from_config)
+_RECOGNIZERS = {}
+_VALIDATORS = {}
+
+
+def _get_or_create_recognizer(config):
+    """Recognizer partagé pour un chemin de modèle donné"""
+    model_path = config.get("vosk", {}).get("model_path")
+    recognizer = _RECOGNIZERS.get(model_path)
+    if recognizer is None:
+        recognizer = ChecklistRecognizer(model_path)
+        _RECOGNIZERS[model_path] = recognizer
+    return recognizer
+
+
+def _get_or_create_validator(config):
+    """Validator partagé pour un seuil fuzzy donné"""
+    fuzzy_threshold = config.get("validation", {}).get("fuzzy_threshold", 80)
+    validator = _VALIDATORS.get(fuzzy_threshold)
+    if validator is None:
+        validator = Validator(fuzzy_threshold=fuzzy_threshold)
+        _VALIDATORS[fuzzy_threshold] = validator
+    return validator
+
+
 class ChecklistManager:
     """
     Gère l'exécution complète de la checklist
     Orchestre : reconnaissance vocale + validation + affichage
     """
     
-    def __init__(self, checklist_template, patient_data, config):
+    def __init__(self, checklist_template, patient_data, config,
+                 recognizer=None, validator=None):
         """
         Initialiser le manager
         
@@ -26,21 +57,62 @@ class ChecklistManager:
             checklist_template (dict): Template checklist depuis JSON
             patient_data (dict): Données patient depuis JSON
             config (dict): Configuration app depuis JSON
+            recognizer (ChecklistRecognizer): Recognizer existant (optionnel)
+            validator (Validator): Validator existant (optionnel)
         """
         self.checklist = checklist_template.get("items", [])
+        self._checklist_len = len(self.checklist)
         self.patient = patient_data
         self.config = config
         
         # Initialiser composants
-        model_path = config.get("vosk", {}).get("model_path")
-        self.recognizer = ChecklistRecognizer(model_path)
-        
-        fuzzy_threshold = config.get("validation", {}).get("fuzzy_threshold", 80)
-        self.validator = Validator(fuzzy_threshold=fuzzy_threshold)
+        if recognizer is None:
+            model_path = config.get("vosk", {}).get("model_path")
+            recognizer = ChecklistRecognizer(model_path)
+        self.recognizer = recognizer
+        
+        if validator is None:
+            fuzzy_threshold = config.get("validation", {}).get("fuzzy_threshold", 80)
+            validator = Validator(fuzzy_threshold=fuzzy_threshold)
+        self.validator = validator
+        
+        # Résolveurs spécialisés par position d'item (valeurs attendues
+        # résolues une fois) : un id absent ou dupliqué ne les mélange pas
+        self._expected_values = {}
+        self._resolvers = [
+            self._make_resolver(item, index) for index, item in enumerate(self.checklist)
+        ]
         
         # Résultats
         self.results = []
     
+    @classmethod
+    def from_config(cls, checklist_template, patient_data, config):
+        """
+        Créer un manager en réutilisant recognizer et validator partagés
+        
+        Évite de recréer le recognizer Vosk à chaque changement de patient
+        ou nouvelle exécution.
+        
+        Args:
+            checklist_template (dict): Template checklist depuis JSON
+            patient_data (dict): Données patient depuis JSON
+            config (dict): Configuration app depuis JSON
+        
+        Returns:
+            ChecklistManager: Manager prêt à l'emploi
+        
+        Exemple:
+            >>> manager = ChecklistManager.from_config(checklist, patient, config)
+        """
+        return cls(
+            checklist_template,
+            patient_data,
+            config,
+            recognizer=_get_or_create_recognizer(config),
+            validator=_get_or_create_validator(config)
+        )
+    
     def run_full_checklist(self):
         """
         Exécuter la checklist complète
@@ -60,28 +132,30 @@ class ChecklistManager:
         self.results = []
         
         try:
-            for idx, item in enumerate(self.checklist, 1):
-                # Header item
-                self._display_item_header(item, idx)
-                
-                # Écouter
-                print("  ⏳ Veuillez répondre...\n")
-                recognized = self.recognizer.listen_for_answer(
-                    timeout=item.get("timeout", 10)
-                )
-                
-                # Valider
-                result = self._validate_item(item, recognized)
-                self.results.append(result)
-                
-                # Afficher résultat
-                self._display_result(result)
-                
-                # Continuer vers suivant
-                if idx < len(self.checklist):
-                    input("\n  ⏸️  Appuyez Entrée pour l'item suivant... ")
-                else:
-                    print("\n  ✅ Tous les items sont testés !")
+            # Flux micro ouvert une seule fois pour toute la checklist
+            with self.recognizer:
+                for idx, item in enumerate(self.checklist, 1):
+                    # Header item
+                    self._display_item_header(item, idx)
+                    
+                    # Écouter
+                    print("  ⏳ Veuillez répondre...\n")
+                    recognized = self.recognizer.listen_for_answer(
+                        timeout=item.get("timeout", 10)
+                    )
+                    
+                    # Valider
+                    result = self._validate_item(item, recognized, idx - 1)
+                    self.results.append(result)
+                    
+                    # Afficher résultat
+                    self._display_result(result)
+                    
+                    # Continuer vers suivant
+                    if idx < self._checklist_len:
+                        input("\n  ⏸️  Appuyez Entrée pour l'item suivant... ")
+                    else:
+                        print("\n  ✅ Tous les items sont testés !")
         
         except KeyboardInterrupt:
             print("\n\n  ⏹️  Programme interrompu par l'utilisateur")
@@ -103,7 +177,7 @@ class ChecklistManager:
         """
         # Chercher item
         item = None
-        for i in self.checklist:
+        for index, i in enumerate(self.checklist):
             if i.get("id") == item_id:
                 item = i
                 break
@@ -122,116 +196,178 @@ class ChecklistManager:
         )
         
         # Valider
-        result = self._validate_item(item, recognized)
+        result = self._validate_item(item, recognized, index)
         
         # Afficher
         self._display_result(result)
         
         return result
     
-    def _validate_item(self, item, recognized):
+    def _make_resolver(self, item, index=None):
         """
-        Valider un item selon son type
+        Construire la fonction de validation d'un item
+        
+        Les paramètres (valeurs attendues, mots-clés...) sont résolus une
+        seule fois ici ; la fonction retournée ne prend que le texte reconnu.
         
         Args:
             item (dict): Configuration de l'item
-            recognized (str): Texte reconnu
+            index (int): Position de l'item dans la checklist (optionnel,
+                         clé des valeurs attendues)
         
         Returns:
-            dict: Résultat validation
+            callable: resolver(recognized) -> dict validation
         """
         validation_type = item.get("validation_type")
         item_type = item.get("type")
-        
-        result = {"item": item, "recognized": recognized}
+        validator = self.validator
         
         if validation_type == "fuzzy_match":
             # Items 1-3 : fuzzy matching contre données patient
+            operation = self.patient.get("operation", {})
             if item_type == "NOM":
                 expected = [self.patient.get("nom", "")]
             elif item_type == "LIEU":
-                expected = [self.patient.get("operation", {}).get("site_operatoire", "")]
+                expected = [operation.get("site_operatoire", "")]
             elif item_type == "INTERVENTION":
-                expected = [self.patient.get("operation", {}).get("type_intervention", "")]
+                expected = [operation.get("type_intervention", "")]
             else:
                 expected = item.get("expected_values", [])
             
-            validation = self.validator.validate_fuzzy_match(recognized, expected)
+            if index is not None:
+                self._expected_values[index] = expected
+            return lambda recognized: validator.validate_fuzzy_match(recognized, expected)
         
-        elif validation_type == "keyword_match":
+        if validation_type == "keyword_match":
             # Items 4-5, 9 : keyword matching
-            validation = self.validator.validate_keyword_match(
-                recognized,
-                item.get("keywords", []),
-                item.get("min_keywords", 1)
+            keywords = item.get("keywords", [])
+            min_keywords = item.get("min_keywords", 1)
+            
+            return lambda recognized: validator.validate_keyword_match(
+                recognized, keywords, min_keywords
             )
         
-        elif validation_type == "concept_detection":
+        if validation_type == "concept_detection":
             # Items 6, 8 : concept detection (NLP avancé)
             # TODO: Charger medical_vocabulary.json
             # validation = self.validator.validate_concept_detection(...)
-            validation = {
+            min_count = item.get("min_count", 1)
+            
+            return lambda recognized: {
                 "valid": True,  # Placeholder
                 "concepts": {},
-                "required": item.get("min_count", 1),
+                "required": min_count,
                 "score": 1,
                 "status": "⚠️ CONCEPT DETECTION (À IMPLÉMENTER)"
             }
         
-        else:
-            validation = {"valid": False, "status": "❌ Type validation inconnu"}
+        return lambda recognized: {"valid": False, "status": "❌ Type validation inconnu"}
+    
+    def _validate_item(self, item, recognized, index=None):
+        """
+        Valider un item selon son type
+        
+        Args:
+            item (dict): Configuration de l'item
+            recognized (str): Texte reconnu
+            index (int): Position de l'item dans la checklist (optionnel,
+                         sinon résolveur construit pour cet appel)
         
-        result.update(validation)
+        Returns:
+            dict: Résultat validation
+        """
+        if index is not None and self.checklist[index] is item:
+            resolver = self._resolvers[index]
+        else:
+            resolver = self._make_resolver(item)
+        
+        result = {
+            "item": item,
+            "item_type": item.get("type", "?"),
+            "validation_type": item.get("validation_type"),
+            "recognized": recognized
+        }
+        result.update(resolver(recognized))
         return result
     
     def _display_item_header(self, item, numero):
         """Afficher header d'un item"""
-        print("\n" + "="*60)
-        print(f"  📋 ITEM {numero}/{len(self.checklist)} - {item.get('type', '')}")
-        print("="*60)
-        print(f"\n  ❓ {item.get('question', '')}")
-        print(f"  💡 {item.get('hint', '')}")
-        print()
+        get = item.get
+        sys.stdout.write(
+            f"\n{_SEP}\n  📋 ITEM {numero}/{self._checklist_len} - {get('type', '')}\n{_SEP}\n"
+            f"\n  ❓ {get('question', '')}\n  💡 {get('hint', '')}\n\n"
+        )
     
     def _display_result(self, result):
         """Afficher résultat validation"""
-        print("\n" + "="*60)
-        print("  📊 RÉSULTAT VALIDATION")
-        print("="*60)
-        print()
-        print(f"  Texte reconnu : '{result.get('recognized', '')}'")
-        print(f"  Score : {result.get('score', 0)}%")
-        print()
-        print(f"  {result.get('status', '???')}")
-        print()
-        print("="*60)
+        get = result.get
+        sys.stdout.write(
+            f"\n{_SEP}\n  📊 RÉSULTAT VALIDATION\n{_SEP}\n\n"
+            f"  Texte reconnu : '{get('recognized', '')}'\n"
+            f"  Score : {get('score', 0)}%\n\n"
+            f"  {get('status', '???')}\n\n{_SEP}\n"
+        )
     
     def _display_summary(self):
         """Afficher résumé final"""
-        print("\n" + "="*60)
-        print("  📊 RÉSUMÉ FINAL")
-        print("="*60)
-        
         valid_count = sum(1 for r in self.results if r.get('valid', False))
         total_count = len(self.results)
         
-        print(f"\n  Items testés : {len(self.results)}/{len(self.checklist)}")
-        print(f"  Items validés : {valid_count}/{total_count}")
+        # Résumé construit en lignes, écrit en une fois
+        lines = [
+            f"\n{_SEP}\n  📊 RÉSUMÉ FINAL\n{_SEP}\n",
+            f"\n  Items testés : {total_count}/{self._checklist_len}\n",
+            f"  Items validés : {valid_count}/{total_count}\n"
+        ]
         
         if total_count > 0:
             percentage = (valid_count / total_count) * 100
-            print(f"  Taux de réussite : {percentage:.0f}%")
+            lines.append(f"  Taux de réussite : {percentage:.0f}%\n")
         
-        print(f"\n  Détail :")
+        lines.append("\n  Détail :\n")
         for i, result in enumerate(self.results, 1):
             status_icon = "✅" if result.get('valid') else "❌"
-            item_type = result.get('item', {}).get('type', '?')
+            item_type = result.get("item_type", "?")
             score = result.get('score', 0)
-            print(f"    {i}. {status_icon} {item_type:15} - Score: {score:3}%")
+            lines.append(f"    {i}. {status_icon} {item_type:15} - Score: {score:3}%\n")
         
-        print()
-        print("="*60)
+        lines.extend(self._fuzzy_candidates_lines())
+        
+        lines.append(f"\n{_SEP}\n")
+        sys.stdout.write("".join(lines))
         input("  ⏸️  Appuyez Entrée pour revenir au menu... ")
+    
+    def _fuzzy_candidates_lines(self):
+        """
+        Lignes des correspondances les plus proches des items fuzzy échoués
+        
+        Tous les textes reconnus sont comparés à toutes les valeurs attendues
+        en un seul calcul groupé (Validator.score_matrix).
+        
+        Returns:
+            list: Lignes à afficher (vide si aucun item fuzzy échoué)
+        """
+        failed = [
+            r for r in self.results
+            if not r.get('valid') and r.get('recognized')
+            and r.get("validation_type") == "fuzzy_match"
+        ]
+        choices = list(dict.fromkeys(
+            value for values in self._expected_values.values() for value in values if value
+        ))
+        
+        if not failed or not choices:
+            return []
+        
+        scores = self.validator.score_matrix([r['recognized'] for r in failed], choices)
+        
+        lines = ["\n  Correspondances proches :\n"]
+        for result, row in zip(failed, scores):
+            item_type = result.get("item_type", "?")
+            best = row.argsort()[::-1][:2]
+            candidates = ", ".join(f"'{choices[j]}' ({row[j]:.0f}%)" for j in best)
+            lines.append(f"    {item_type:15} → {candidates}\n")
+        return lines
 
 
 # Exemple d'utilisation
@@ -8,17 +8,120 @@ Module pour :
 - Gérer timeouts et erreurs
 """
 
+import collections
 import json
 import queue
 import os
 import sys
+import threading
 import time
 from vosk import Model, KaldiRecognizer, SetLogLevel
 import sounddevice as sd
 
+try:
+    import orjson  # Parsing JSON rapide (optionnel)
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Silencer logs Vosk
 SetLogLevel(-1)
 
+# Marqueurs JSON Vosk d'un résultat vide (évite un parsing inutile)
+_EMPTY_TEXT = '"text" : ""'
+_EMPTY_PARTIAL = '"partial" : ""'
+
+# Cache modèles Vosk chargés (partagé entre instances, clé = chemin)
+_MODEL_CACHE = {}
+_MODEL_LOCK = threading.Lock()
+
+
+def _get_model(model_path):
+    """
+    Récupérer modèle Vosk depuis le cache (chargement au premier appel)
+    
+    Args:
+        model_path (str): Chemin vers modèle Vosk
+    
+    Returns:
+        Model: Modèle Vosk partagé
+    """
+    key = os.path.abspath(model_path)
+    with _MODEL_LOCK:
+        model = _MODEL_CACHE.get(key)
+        if model is None:
+            model = Model(model_path)
+            _MODEL_CACHE[key] = model
+    return model
+
+
+class _DecoderWorker(threading.Thread):
+    """
+    Thread de décodage Vosk
+    
+    Consomme la file audio de l'owner (ChecklistRecognizer) et appelle
+    AcceptWaveform hors du thread principal. Publie le premier texte
+    final non vide (ou l'exception rencontrée) dans `results`.
+    """
+    
+    def __init__(self, owner, show_partial, partial_interval, start_time):
+        """
+        Args:
+            owner (ChecklistRecognizer): Recognizer propriétaire (file + décodeur)
+            show_partial (bool): Afficher reconnaissance partielle
+            partial_interval (float): Intervalle min entre affichages partiels (sec)
+            start_time (float): Début écoute (time.time())
+        """
+        super().__init__(daemon=True)
+        self.owner = owner
+        self.show_partial = show_partial
+        self.partial_interval = partial_interval
+        self.start_time = start_time
+        self.stop_event = threading.Event()
+        self.results = queue.Queue(maxsize=1)
+    
+    def run(self):
+        """Boucle de décodage jusqu'au texte final ou arrêt"""
+        recognizer = self.owner.recognizer
+        last_partial = 0.0
+        
+        try:
+            while not self.stop_event.is_set():
+                try:
+                    data = self.owner._read_audio()
+                except queue.Empty:
+                    continue
+                
+                # Traiter audio
+                if recognizer.AcceptWaveform(data):
+                    # RÉSULTAT FINAL (pas de parsing si texte vide)
+                    raw = recognizer.Result()
+                    if _EMPTY_TEXT in raw:
+                        continue
+                    recognized = _json_loads(raw).get('text', '')
+                    
+                    if recognized:
+                        self.results.put(recognized)
+                        return
+                
+                elif self.show_partial:
+                    # Affichage partiel (temps réel, limité à 1 / partial_interval)
+                    now = time.monotonic()
+                    if now - last_partial < self.partial_interval:
+                        continue
+                    last_partial = now
+                    
+                    raw = recognizer.PartialResult()
+                    if _EMPTY_PARTIAL in raw:
+                        continue
+                    partial_text = _json_loads(raw).get('partial', '')
+                    if partial_text:
+                        elapsed = time.time() - self.start_time
+                        print(f"   💬 [{elapsed:.1f}s] {partial_text}", end='\r', flush=True)
+        
+        except Exception as e:
+            self.results.put(e)
+
 
 class ChecklistRecognizer:
     """
@@ -43,6 +146,13 @@ class ChecklistRecognizer:
         self.blocksize = blocksize
         self.audio_queue = queue.Queue()
         
+        # Tampons audio réutilisables (aucune allocation dans le callback)
+        self._buffer_pool = collections.deque()
+        
+        # Flux micro persistant (voir start/stop) + porte d'écoute
+        self._stream = None
+        self._active = threading.Event()
+        
         # Vérifier modèle existe
         if not os.path.exists(model_path):
             raise FileNotFoundError(
@@ -51,93 +161,189 @@ class ChecklistRecognizer:
                 f"   Télécharger depuis : https://alphacephei.com/vosk/models"
             )
         
-        # Charger modèle
+        # Charger modèle (partagé) + recognizer (propre à l'instance)
         try:
             print(f"📦 Chargement modèle Vosk...")
-            self.model = Model(model_path)
+            self.model = _get_model(model_path)
             self.recognizer = KaldiRecognizer(self.model, self.sample_rate)
             print(f"✅ Modèle chargé\n")
         except Exception as e:
             raise RuntimeError(f"❌ Erreur chargement modèle : {e}")
     
+    def start(self):
+        """
+        Ouvrir le flux micro persistant
+        
+        Le flux reste ouvert entre les items : seul l'audio capturé
+        pendant listen_for_answer() est transmis au recognizer.
+        
+        Raises:
+            Exception: Si périphérique audio indisponible
+        """
+        if self._stream is None:
+            stream = sd.RawInputStream(
+                samplerate=self.sample_rate,
+                blocksize=self.blocksize,
+                dtype='int16',
+                channels=1,
+                callback=self.audio_callback,
+                latency='low'
+            )
+            stream.start()
+            self._stream = stream
+        return self
+    
+    def stop(self):
+        """Fermer le flux micro persistant"""
+        self._active.clear()
+        if self._stream is not None:
+            try:
+                self._stream.stop()
+                self._stream.close()
+            finally:
+                self._stream = None
+    
+    def __enter__(self):
+        """
+        Ouvrir le flux pour une série d'items
+        
+        En cas d'erreur micro, listen_for_answer() retentera l'ouverture
+        et affichera l'erreur item par item (comportement historique).
+        """
+        try:
+            self.start()
+        except Exception:
+            self._stream = None
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Fermer le flux en sortie de série"""
+        self.stop()
+        return False
+    
     def audio_callback(self, indata, frames, time_info, status):
         """
         Callback pour capturer l'audio
         Appelé automatiquement par sounddevice
+        
+        Audio ignoré hors écoute active (flux persistant entre items)
         """
         if status:
             pass  # Ignorer status messages
-        self.audio_queue.put(bytes(indata))
+        if self._active.is_set():
+            try:
+                buf = self._buffer_pool.pop()
+            except IndexError:
+                buf = bytearray(len(indata))
+            buf[:] = indata
+            self.audio_queue.put(buf)
+    
+    def _drain_queue(self):
+        """Vider la file audio (blocs résiduels d'une écoute précédente)"""
+        while True:
+            try:
+                self._buffer_pool.append(self.audio_queue.get_nowait())
+            except queue.Empty:
+                break
+    
+    def _read_audio(self, timeout=0.1):
+        """
+        Lire l'audio disponible en un seul bloc
+        
+        Attend un premier bloc (timeout court) puis regroupe tous les
+        blocs déjà en file : un seul AcceptWaveform par itération.
+        
+        Args:
+            timeout (float): Attente max du premier bloc (sec)
+        
+        Returns:
+            bytes: Audio regroupé (Vosk/cffi n'accepte que bytes)
+        
+        Raises:
+            queue.Empty: Si aucun bloc reçu avant timeout
+        
+        Note:
+            Les tampons lus sont rendus au pool du callback
+        """
+        chunks = [self.audio_queue.get(timeout=timeout)]
+        while True:
+            try:
+                chunks.append(self.audio_queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        data = b"".join(chunks)
+        self._buffer_pool.extend(chunks)
+        return data
     
-    def listen_for_answer(self, timeout=10, show_partial=True):
+    def listen_for_answer(self, timeout=10, show_partial=True, partial_interval=0.2):
         """
         Écouter une réponse vocale
         
         Args:
             timeout (int): Durée d'écoute max (sec)
             show_partial (bool): Afficher reconnaissance partielle
+            partial_interval (float): Intervalle min entre deux affichages
+                                      partiels (sec)
         
         Returns:
             str: Texte reconnu
         
         Note:
-            - Micro activé UNIQUEMENT pendant cette fonction
-            - Micro fermé après (économie ressources)
+            - Micro écouté UNIQUEMENT pendant cette fonction
+            - Si aucun flux persistant (start / with), le micro est
+              ouvert puis fermé pour cet appel seulement
         """
         recognized = ""
         start_time = time.time()
+        owns_stream = self._stream is None
         
         try:
-            # OUVERTURE MICRO
-            with sd.RawInputStream(
-                samplerate=self.sample_rate,
-                blocksize=self.blocksize,
-                dtype='int16',
-                channels=1,
-                callback=self.audio_callback,
-                latency='low'
-            ):
-                print("   🎤 Micro ACTIF - Parlez maintenant...")
+            # OUVERTURE MICRO (si pas de flux persistant)
+            if owns_stream:
+                self.start()
+            
+            self._drain_queue()
+            self._active.set()
+            
+            print("   🎤 Micro ACTIF - Parlez maintenant...")
+            print("   " + "-" * 50)
+            
+            # Décodage sur thread dédié, attente du résultat ici
+            worker = _DecoderWorker(self, show_partial, partial_interval, start_time)
+            worker.start()
+            try:
+                outcome = worker.results.get(timeout=timeout)
+            except queue.Empty:
+                outcome = ""
+            finally:
+                worker.stop_event.set()
+                worker.join()
+            
+            if isinstance(outcome, Exception):
+                raise outcome
+            recognized = outcome
+            
+            if recognized:
+                print(f"   ✅ Phrase reconnue : '{recognized}'")
+                print("   " + "-" * 50)
+            else:
+                # Timeout
+                print("\n   ⏱️  TIMEOUT - Aucun texte reconnu")
                 print("   " + "-" * 50)
-                
-                # Boucle d'écoute
-                while time.time() - start_time < timeout:
-                    try:
-                        data = self.audio_queue.get(timeout=0.3)
-                        
-                        # Traiter audio
-                        if self.recognizer.AcceptWaveform(data):
-                            # RÉSULTAT FINAL
-                            result = json.loads(self.recognizer.Result())
-                            recognized = result.get('text', '')
-                            
-                            if recognized:
-                                print(f"   ✅ Phrase reconnue : '{recognized}'")
-                                print("   " + "-" * 50)
-                                break
-                        else:
-                            # Affichage partiel (temps réel)
-                            if show_partial:
-                                partial = json.loads(self.recognizer.PartialResult())
-                                partial_text = partial.get('partial', '')
-                                if partial_text:
-                                    elapsed = time.time() - start_time
-                                    print(f"   💬 [{elapsed:.1f}s] {partial_text}", end='\r', flush=True)
-                    
-                    except queue.Empty:
-                        continue
-                
-                # Vérifier timeout
-                if not recognized:
-                    print("\n   ⏱️  TIMEOUT - Aucun texte reconnu")
-                    print("   " + "-" * 50)
         
         except Exception as e:
             print(f"   ❌ Erreur microphone : {e}")
             print("   Vérifiez que votre microphone fonctionne correctement")
             print("   " + "-" * 50)
         
-        # FERMETURE MICRO (hors du bloc with)
+        finally:
+            # FIN ÉCOUTE : audio ignoré, décodeur remis à zéro
+            self._active.clear()
+            self.recognizer.Reset()
+            if owns_stream:
+                self.stop()
+        
         return recognized
     
     def reset_recognizer(self):
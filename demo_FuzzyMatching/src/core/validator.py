@@ -8,7 +8,83 @@ Module pour :
 - Valider concept detection
 """
 
-from rapidfuzz import fuzz
+import functools
+
+import numpy as np
+from rapidfuzz import fuzz, process
+
+try:
+    import ahocorasick  # pyahocorasick (optionnel)
+except ImportError:
+    ahocorasick = None
+
+
+# Table accents -> ASCII (un seul passage C via str.translate)
+_ACCENT_TABLE = str.maketrans({
+    'à': 'a', 'ç': 'c', 'é': 'e', 'è': 'e', 'ê': 'e',
+    'ô': 'o', 'ù': 'u', 'û': 'u', 'ü': 'u',
+    'î': 'i', 'ï': 'i'
+})
+
+
+@functools.lru_cache(maxsize=256)
+def _build_automaton(terms_norm):
+    """
+    Construire automate Aho-Corasick pour une liste de termes normalisés
+    
+    Args:
+        terms_norm (tuple): Termes normalisés (hashable pour le cache)
+    
+    Returns:
+        ahocorasick.Automaton: Automate {terme: [indices]} ou None si vide
+    """
+    automaton = ahocorasick.Automaton()
+    for idx, term in enumerate(terms_norm):
+        if not term:
+            continue
+        if term in automaton:
+            automaton.get(term).append(idx)
+        else:
+            automaton.add_word(term, [idx])
+    
+    if len(automaton) == 0:
+        return None
+    
+    automaton.make_automaton()
+    return automaton
+
+
+def _match_terms(text_norm, terms_norm):
+    """
+    Trouver les termes présents dans le texte (un seul parcours du texte)
+    
+    Args:
+        text_norm (str): Texte normalisé
+        terms_norm (tuple): Termes normalisés
+    
+    Returns:
+        set: Indices des termes trouvés
+    
+    Note:
+        Sans pyahocorasick : repli sur recherche sous-chaîne terme par terme,
+        en écartant d'abord les termes plus longs que le texte
+    """
+    if ahocorasick is None:
+        text_len = len(text_norm)
+        return {
+            idx for idx, term in enumerate(terms_norm)
+            if len(term) <= text_len and term in text_norm
+        }
+    
+    # Terme vide = toujours contenu (même sémantique que `in`)
+    hits = {idx for idx, term in enumerate(terms_norm) if not term}
+    
+    automaton = _build_automaton(terms_norm)
+    if automaton is not None:
+        for _, indices in automaton.iter(text_norm):
+            hits.update(indices)
+    
+    return hits
 
 
 class Validator:
@@ -26,7 +102,9 @@ class Validator:
         """
         self.fuzzy_threshold = fuzzy_threshold
     
-    def normalize_text(self, text):
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def normalize_text(text):
         """
         Normaliser texte pour comparaison
         
@@ -41,6 +119,10 @@ class Validator:
             - Suppression accents
             - Suppression ponctuation
             - Suppression espaces multiples
+        
+        Note:
+            Résultat mis en cache (LRU) : valeurs attendues, mots-clés et
+            termes du vocabulaire sont statiques pendant une session
         """
         if not text:
             return ""
@@ -48,14 +130,9 @@ class Validator:
         # Minuscules
         text = text.lower().strip()
         
-        # Accents
-        accents = {
-            'à': 'a', 'ç': 'c', 'é': 'e', 'è': 'e', 'ê': 'e',
-            'ô': 'o', 'ù': 'u', 'û': 'u', 'ü': 'u',
-            'î': 'i', 'ï': 'i'
-        }
-        for old, new in accents.items():
-            text = text.replace(old, new)
+        # Accents (texte ASCII, cas courant : rien à traduire)
+        if not text.isascii():
+            text = text.translate(_ACCENT_TABLE)
         
         # Espaces multiples
         text = ' '.join(text.split())
@@ -89,7 +166,7 @@ class Validator:
             >>> result['valid']
             True
             >>> result['score']
-            100
+            100.0
         """
         if not recognized:
             return {
@@ -104,16 +181,22 @@ class Validator:
         recognized_norm = self.normalize_text(recognized)
         
         # Chercher meilleure correspondance
+        expected_norms = [self.normalize_text(expected) for expected in expected_values]
+        
         best_score = 0
         best_match = None
-        
-        for expected in expected_values:
-            expected_norm = self.normalize_text(expected)
-            score = fuzz.ratio(recognized_norm, expected_norm)
-            
-            if score > best_score:
-                best_score = score
-                best_match = expected
+        if recognized_norm in expected_norms:
+            # Correspondance exacte : aucun calcul de distance
+            best_score = 100.0
+            best_match = expected_values[expected_norms.index(recognized_norm)]
+        else:
+            # Un seul appel C++ rapidfuzz ; extractOne relève son seuil au
+            # meilleur score courant et s'arrête dès 100. Pas de score_cutoff
+            # au seuil de validation : le score réel reste affiché en échec.
+            best = process.extractOne(recognized_norm, expected_norms, scorer=fuzz.ratio)
+            if best is not None and best[1] > 0:
+                best_score = best[1]
+                best_match = expected_values[best[2]]
         
         # Déterminer résultat
         is_valid = best_score >= self.fuzzy_threshold
@@ -128,6 +211,91 @@ class Validator:
             "status": status
         }
     
+    def score_matrix(self, queries, choices, dtype=np.float64):
+        """
+        Scores fuzzy de plusieurs textes contre plusieurs candidats
+        
+        Un seul appel rapidfuzz (process.cdist, multi-thread) au lieu de
+        len(queries) x len(choices) appels fuzz.ratio.
+        
+        Args:
+            queries (list): Textes reconnus
+            choices (list): Valeurs candidates
+            dtype: Type numpy des scores (float64 : mêmes scores que
+                   validate_fuzzy_match, à comparer au seuil sans arrondi)
+        
+        Returns:
+            numpy.ndarray: Matrice scores (%) de forme (len(queries), len(choices))
+        
+        Exemple:
+            >>> scores = validator.score_matrix(
+            ...     ["marie dupont", "genou"],
+            ...     ["marie dupont", "genou gauche"]
+            ... )
+            >>> scores.shape
+            (2, 2)
+        """
+        queries_norm = [self.normalize_text(q) for q in queries]
+        choices_norm = [self.normalize_text(c) for c in choices]
+        return process.cdist(
+            queries_norm, choices_norm, scorer=fuzz.ratio, workers=-1, dtype=dtype
+        )
+    
+    def validate_fuzzy_batch(self, recognized_list, expected_values):
+        """
+        Validation fuzzy matching de plusieurs textes en une fois
+        
+        Args:
+            recognized_list (list): Textes reconnus
+            expected_values (list): Valeurs attendues (communes à tous)
+        
+        Returns:
+            list: Un résultat par texte (mêmes clés, scores et statuts que
+                  validate_fuzzy_match)
+        
+        Exemple:
+            >>> results = validator.validate_fuzzy_batch(
+            ...     ["marie dupont", "jean martin"],
+            ...     ["marie dupont"]
+            ... )
+            >>> [r['valid'] for r in results]
+            [True, False]
+        """
+        if not recognized_list:
+            return []
+        
+        if expected_values:
+            scores = self.score_matrix(recognized_list, expected_values)
+            best_scores = scores.max(axis=1)
+            best_idx = scores.argmax(axis=1)
+        else:
+            best_scores = np.zeros(len(recognized_list))
+            best_idx = np.zeros(len(recognized_list), dtype=np.intp)
+        valid_mask = best_scores >= self.fuzzy_threshold
+        
+        results = []
+        for recognized, score, idx, is_valid in zip(
+            recognized_list, best_scores.tolist(), best_idx.tolist(), valid_mask.tolist()
+        ):
+            if not recognized:
+                results.append(self.validate_fuzzy_match(recognized, expected_values))
+                continue
+            
+            # Aucune ressemblance : 0 entier, comme validate_fuzzy_match
+            if score == 0:
+                score = 0
+            
+            results.append({
+                "valid": is_valid,
+                "recognized": recognized,
+                "recognized_normalized": self.normalize_text(recognized),
+                "best_match": expected_values[idx] if score > 0 else None,
+                "score": score,
+                "status": f"✅ VALIDÉ ({score}%)" if is_valid else f"❌ ÉCHOUÉ ({score}%)"
+            })
+        
+        return results
+    
     def validate_keyword_match(self, recognized, keywords, min_keywords=1):
         """
         Validation keyword matching
@@ -168,12 +336,10 @@ class Validator:
         # Normaliser
         text_norm = self.normalize_text(recognized)
         
-        # Chercher mots-clés
-        found = []
-        for kw in keywords:
-            kw_norm = self.normalize_text(kw)
-            if kw_norm in text_norm:
-                found.append(kw)
+        # Chercher mots-clés (Aho-Corasick : un seul parcours du texte)
+        keywords_norm = tuple(self.normalize_text(kw) for kw in keywords)
+        hits = _match_terms(text_norm, keywords_norm)
+        found = [kw for idx, kw in enumerate(keywords) if idx in hits]
         
         # Valider
         is_valid = len(found) >= min_keywords
@@ -187,7 +353,50 @@ class Validator:
             "status": status
         }
     
-    def validate_concept_detection(self, recognized, concepts_dict, required_concepts, min_count=1):
+    @staticmethod
+    def prepare_concepts(concepts_dict, categories=None):
+        """
+        Aplatir un vocabulaire de concepts en tableaux parallèles
+        
+        À appeler une fois par chargement de vocabulaire : le résultat
+        peut être passé à validate_concept_detection(prepared=...).
+        
+        Args:
+            concepts_dict (dict): {"risques": [...]} ou
+                                  {"risques": {"termes": [...]}}
+            categories (list): Catégories à retenir (optionnel, toutes sinon)
+        
+        Returns:
+            tuple: (terms_norm, categories, originals) - tuples de même longueur
+        
+        Exemple:
+            >>> prepared = Validator.prepare_concepts({"risques": ["Hypothermie"]})
+            >>> prepared
+            (('hypothermie',), ('risques',), ('Hypothermie',))
+        """
+        if categories is None:
+            categories = list(concepts_dict.keys())
+        
+        terms_norm = []
+        term_categories = []
+        originals = []
+        
+        for category in dict.fromkeys(categories):
+            terms = concepts_dict.get(category)
+            if terms is None:
+                continue
+            if isinstance(terms, dict):
+                terms = terms.get("termes", [])
+            
+            for term in terms:
+                terms_norm.append(Validator.normalize_text(term))
+                term_categories.append(category)
+                originals.append(term)
+        
+        return tuple(terms_norm), tuple(term_categories), tuple(originals)
+    
+    def validate_concept_detection(self, recognized, concepts_dict, required_concepts,
+                                   min_count=1, prepared=None):
         """
         Validation concept detection (NLP avancé)
         
@@ -196,6 +405,7 @@ class Validator:
             concepts_dict (dict): Dictionnaire concepts {"risques": [...], "traitements": [...]}
             required_concepts (list): Concepts recherchés ["risques", "traitements"]
             min_count (int): Nombre minimum de concepts trouvés
+            prepared (tuple): Vocabulaire aplati via prepare_concepts() (optionnel)
         
         Returns:
             dict: Résultat validation
@@ -231,17 +441,18 @@ class Validator:
         # Normaliser
         text_norm = self.normalize_text(recognized)
         
-        # Chercher concepts
+        # Vocabulaire aplati (un seul parcours pour toutes les catégories)
+        if prepared is None:
+            prepared = self.prepare_concepts(concepts_dict, required_concepts)
+        terms_norm, categories, originals = prepared
+        
+        # Chercher concepts, regroupés par catégorie (ordre du vocabulaire)
+        wanted = set(required_concepts)
         concepts_found = {}
-        for concept_category in required_concepts:
-            if concept_category in concepts_dict:
-                found_terms = []
-                for term in concepts_dict[concept_category]:
-                    term_norm = self.normalize_text(term)
-                    if term_norm in text_norm:
-                        found_terms.append(term)
-                if found_terms:
-                    concepts_found[concept_category] = found_terms
+        for idx in sorted(_match_terms(text_norm, terms_norm)):
+            category = categories[idx]
+            if category in wanted:
+                concepts_found.setdefault(category, []).append(originals[idx])
         
         # Valider
         total_concepts = len(concepts_found)
@@ -315,7 +526,8 @@ class Validator:
                 recognized,
                 kwargs.get("concepts_dict", {}),
                 kwargs.get("required_concepts", []),
-                kwargs.get("min_count", 1)
+                kwargs.get("min_count", 1),
+                kwargs.get("prepared")
             )
         
         else:
@@ -10,25 +10,36 @@ Module pour gérer la configuration de l'application :
 """
 
 import json
-from typing import Any, Dict, Optional
+import sys
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 from .data_loader import DataLoader
 
 
+# Sections obligatoires de la configuration app
+_REQUIRED_KEYS = frozenset(("app", "vosk", "audio", "validation", "checklist"))
+
 class ConfigLoader:
     """
     Charge et gère la configuration de l'application
     Centralise accès à tous les paramètres de config
     """
     
-    # Configuration en cache (singleton)
+    # Configuration en cache (singleton, chargée au premier accès)
     _config = None
     _validation_rules = None
     
+    # Index plat {(section, clé): valeur}, construit une fois après chargement
+    _flat = None
+    
     @staticmethod
     def load():
         """
         Charger la configuration complète
         
+        Optionnel : les getters chargent la configuration au premier accès.
+        load() force le chargement des deux fichiers et leur validation.
+        
         Returns:
             dict: Configuration app + règles validation
         
@@ -41,14 +52,15 @@ class ConfigLoader:
             >>> app_name = ConfigLoader.get_app_name()
         """
         try:
-            # Charger config app
-            ConfigLoader._config = DataLoader.load_config(use_complet=True)
-            
-            # Charger règles validation
-            ConfigLoader._validation_rules = DataLoader.load_validation_rules(use_complet=True)
+            # Charger config app + règles validation (lectures groupées)
+            ConfigLoader._config, ConfigLoader._validation_rules = DataLoader.load_json_many([
+                DataLoader.DEFAULT_PATHS["config_complet"],
+                DataLoader.DEFAULT_PATHS["validation_rules_complet"]
+            ])
             
             # Valider configuration
             ConfigLoader._validate_config()
+            ConfigLoader._build_flat()
             
             return {
                 "config": ConfigLoader._config,
@@ -58,6 +70,68 @@ class ConfigLoader:
         except Exception as e:
             raise ValueError(f"Erreur chargement configuration : {e}")
     
+    @staticmethod
+    def _ensure_config() -> Dict:
+        """
+        Charger la configuration app au premier accès (paresseux)
+        
+        Returns:
+            dict: Configuration app ({} si fichier absent : les getters
+            retournent alors leurs valeurs par défaut)
+        
+        Raises:
+            json.JSONDecodeError: Si fichier JSON invalide (jamais masqué)
+        
+        Note:
+            Fichier absent : {} n'est pas mis en cache, le prochain accès
+            retente le chargement
+        """
+        if ConfigLoader._config is None:
+            try:
+                ConfigLoader._config = DataLoader.load_config(use_complet=True)
+            except FileNotFoundError:
+                return {}
+        return ConfigLoader._config
+    
+    @staticmethod
+    def _build_flat() -> Dict:
+        """
+        Aplatir la configuration en index {(section, clé): valeur}
+        
+        Returns:
+            dict: Index plat (une seule recherche par getter)
+        """
+        config = ConfigLoader._ensure_config()
+        flat = {
+            (section, key): value
+            for section, section_data in config.items()
+            if isinstance(section_data, dict)
+            for key, value in section_data.items()
+        }
+        
+        # Index conservé seulement si la configuration a été chargée
+        if ConfigLoader._config is not None:
+            ConfigLoader._flat = flat
+        return flat
+    
+    @staticmethod
+    def _ensure_rules() -> Dict:
+        """
+        Charger les règles validation au premier accès (paresseux)
+        
+        Returns:
+            dict: Règles validation ({} si fichier absent, non mis en cache)
+        
+        Raises:
+            json.JSONDecodeError: Si fichier JSON invalide (jamais masqué)
+        """
+        if ConfigLoader._validation_rules is None:
+            try:
+                ConfigLoader._validation_rules = DataLoader.load_validation_rules(use_complet=True)
+            except FileNotFoundError:
+                return {}
+        return ConfigLoader._validation_rules
+    
     @staticmethod
     def _validate_config():
         """Valider que la configuration est correcte"""
@@ -67,11 +141,10 @@ class ConfigLoader:
         if not ConfigLoader._validation_rules:
             raise ValueError("Règles validation non chargées")
         
-        # Vérifier clés essentielles
-        required_keys = ["app", "vosk", "audio", "validation", "checklist"]
-        for key in required_keys:
-            if key not in ConfigLoader._config:
-                raise ValueError(f"Clé config manquante : {key}")
+        # Vérifier clés essentielles (une différence d'ensembles)
+        missing = _REQUIRED_KEYS - ConfigLoader._config.keys()
+        if missing:
+            raise ValueError(f"Clé config manquante : {', '.join(sorted(missing))}")
     
     # =====================================================================
     # APP INFO
@@ -290,29 +363,24 @@ class ConfigLoader:
         Returns:
             dict: Règles de l'item ou None
         """
-        if not ConfigLoader._validation_rules:
+        rules = ConfigLoader._ensure_rules()
+        if not rules:
             return None
         
-        items = ConfigLoader._validation_rules.get("items_complexes", {})
+        items = rules.get("items_complexes", {})
         item_key = f"item_{item_id}"
         
         return items.get(item_key)
     
     @staticmethod
-    def get_scoring_system() -> Dict:
-        """Récupérer système de scoring"""
-        if not ConfigLoader._validation_rules:
-            return {}
-        
-        return ConfigLoader._validation_rules.get("scoring_system", {})
+    def get_scoring_system() -> Mapping:
+        """Récupérer système de scoring (vue lecture seule)"""
+        return MappingProxyType(ConfigLoader._ensure_rules().get("scoring_system", {}))
     
     @staticmethod
-    def get_error_handling() -> Dict:
-        """Récupérer gestion des erreurs"""
-        if not ConfigLoader._validation_rules:
-            return {}
-        
-        return ConfigLoader._validation_rules.get("gestion_erreurs", {})
+    def get_error_handling() -> Mapping:
+        """Récupérer gestion des erreurs (vue lecture seule)"""
+        return MappingProxyType(ConfigLoader._ensure_rules().get("gestion_erreurs", {}))
     
     # =====================================================================
     # UTILITIES
@@ -331,40 +399,50 @@ class ConfigLoader:
         Returns:
             Any: Valeur ou défaut
         """
-        if not ConfigLoader._config:
-            return default
+        flat = ConfigLoader._flat
+        if flat is None:
+            flat = ConfigLoader._build_flat()
         
-        section_data = ConfigLoader._config.get(section, {})
-        return section_data.get(key, default)
+        return flat.get((section, key), default)
     
     @staticmethod
-    def get_all_config() -> Dict:
-        """Récupérer toute la configuration"""
-        return ConfigLoader._config or {}
+    def get_all_config() -> Mapping:
+        """
+        Récupérer toute la configuration
+        
+        Returns:
+            Mapping: Vue lecture seule, sans copie (les sous-sections
+            restent les dicts partagés : ne pas les modifier)
+        """
+        return MappingProxyType(ConfigLoader._ensure_config())
     
     @staticmethod
-    def get_all_rules() -> Dict:
-        """Récupérer toutes les règles"""
-        return ConfigLoader._validation_rules or {}
+    def get_all_rules() -> Mapping:
+        """Récupérer toutes les règles (vue lecture seule, sans copie)"""
+        return MappingProxyType(ConfigLoader._ensure_rules())
     
     @staticmethod
     def print_summary():
-        """Afficher résumé configuration"""
-        print("\n" + "="*60)
-        print("  ⚙️  CONFIGURATION RÉSUMÉ")
-        print("="*60)
-        print(f"\n  Application: {ConfigLoader.get_app_name()} v{ConfigLoader.get_app_version()}")
-        print(f"  Mode debug: {'✅' if ConfigLoader.is_debug_mode() else '❌'}")
-        print(f"  Mode test: {'✅' if ConfigLoader.is_test_mode() else '❌'}")
-        print(f"\n  Vosk:")
-        print(f"    - Modèle: {ConfigLoader.get_vosk_model_path()}")
-        print(f"    - Sample rate: {ConfigLoader.get_vosk_sample_rate()} Hz")
-        print(f"\n  Audio:")
-        print(f"    - Timeout: {ConfigLoader.get_listen_timeout()}s")
-        print(f"    - Reconnaissance partielle: {'✅' if ConfigLoader.is_partial_enabled() else '❌'}")
-        print(f"\n  Validation:")
-        print(f"    - Seuil fuzzy: {ConfigLoader.get_fuzzy_threshold()}%")
-        print(f"\n" + "="*60 + "\n")
+        """Afficher résumé configuration (une seule écriture stdout)"""
+        sep = "=" * 60
+        
+        sys.stdout.write(
+            f"\n{sep}\n"
+            f"  ⚙️  CONFIGURATION RÉSUMÉ\n"
+            f"{sep}\n"
+            f"\n  Application: {ConfigLoader.get_app_name()} v{ConfigLoader.get_app_version()}\n"
+            f"  Mode debug: {'✅' if ConfigLoader.is_debug_mode() else '❌'}\n"
+            f"  Mode test: {'✅' if ConfigLoader.is_test_mode() else '❌'}\n"
+            f"\n  Vosk:\n"
+            f"    - Modèle: {ConfigLoader.get_vosk_model_path()}\n"
+            f"    - Sample rate: {ConfigLoader.get_vosk_sample_rate()} Hz\n"
+            f"\n  Audio:\n"
+            f"    - Timeout: {ConfigLoader.get_listen_timeout()}s\n"
+            f"    - Reconnaissance partielle: {'✅' if ConfigLoader.is_partial_enabled() else '❌'}\n"
+            f"\n  Validation:\n"
+            f"    - Seuil fuzzy: {ConfigLoader.get_fuzzy_threshold()}%\n"
+            f"\n{sep}\n\n"
+        )
 
 
 # Exemple d'utilisation
@@ -9,9 +9,53 @@ Module pour charger tous les fichiers JSON :
 - Règles validation
 """
 
+import functools
 import json
+import mmap
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
+
+# orjson optionnel (parsing C/Rust plus rapide), repli sur json standard
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Racine projet (calculée une seule fois)
+_PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# Taille (octets) au-delà de laquelle le JSON est lu via mmap (orjson)
+_MMAP_THRESHOLD = 1 << 16
+
+# Longueur max des valeurs str internées (clés toujours internées)
+_INTERN_MAX_LEN = 64
+
+
+def _intern_tree(obj):
+    """
+    Interner clés et chaînes courtes d'un arbre JSON (dédoublonnage mémoire)
+    
+    Args:
+        obj: Données JSON parsées (dict, list, str, ...)
+    
+    Returns:
+        Mêmes données, chaînes répétées partagées via sys.intern
+    
+    Note:
+        Types exacts (type() is) plutôt qu'isinstance : les parseurs JSON
+        ne produisent que dict/list/str, un seul appel type() par valeur
+    """
+    kind = type(obj)
+    if kind is dict:
+        return {sys.intern(k): _intern_tree(v) for k, v in obj.items()}
+    if kind is list:
+        return [_intern_tree(v) for v in obj]
+    if kind is str and len(obj) < _INTERN_MAX_LEN:
+        return sys.intern(obj)
+    return obj
 
 
 class DataLoader:
@@ -20,24 +64,32 @@ class DataLoader:
     Gère les chemins relatifs et erreurs
     """
     
-    # Chemins par défaut (relatifs à racine projet)
-    DEFAULT_PATHS = {
-        "config": "data/config/app_config.json",
-        "config_complet": "data/config/app_config_COMPLET.json",
-        "validation_rules": "data/config/validation_rules.json",
-        "validation_rules_complet": "data/config/validation_rules_COMPLET.json",
-        "checklist_template": "data/templates/checklist_template.json",
-        "checklist_template_complet": "data/templates/checklist_template_COMPLET.json",
-        "medical_vocabulary": "data/templates/medical_vocabulary.json",
-        "medical_vocabulary_complet": "data/templates/medical_vocabulary_COMPLET.json",
-        "patient_template": "data/templates/patient_template.json",
-        "patients_dir": "data/patients/"
-    }
+    # Chemins par défaut (relatifs à racine projet), résolus en absolu une
+    # fois à l'import : table unique en lecture seule
+    DEFAULT_PATHS = MappingProxyType({
+        name: str(_PROJECT_ROOT / path)
+        for name, path in {
+            "config": "data/config/app_config.json",
+            "config_complet": "data/config/app_config_COMPLET.json",
+            "validation_rules": "data/config/validation_rules.json",
+            "validation_rules_complet": "data/config/validation_rules_COMPLET.json",
+            "checklist_template": "data/templates/checklist_template.json",
+            "checklist_template_complet": "data/templates/checklist_template_COMPLET.json",
+            "medical_vocabulary": "data/templates/medical_vocabulary.json",
+            "medical_vocabulary_complet": "data/templates/medical_vocabulary_COMPLET.json",
+            "patient_template": "data/templates/patient_template.json",
+            "patients_dir": "data/patients/"
+        }.items()
+    })
+    
+    # Cache JSON parsés : {chemin absolu: ((mtime_ns, taille), données)}
+    _cache = {}
     
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _get_absolute_path(relative_path):
         """
-        Convertir chemin relatif en absolu
+        Convertir chemin relatif en absolu (résultat mis en cache)
         
         Args:
             relative_path (str): Chemin relatif depuis racine projet
@@ -45,10 +97,7 @@ class DataLoader:
         Returns:
             str: Chemin absolu
         """
-        # Depuis racine projet
-        project_root = Path(__file__).parent.parent.parent
-        absolute_path = project_root / relative_path
-        return str(absolute_path)
+        return str(_PROJECT_ROOT / relative_path)
     
     @staticmethod
     def load_json(filepath):
@@ -65,6 +114,11 @@ class DataLoader:
             FileNotFoundError: Si fichier n'existe pas
             json.JSONDecodeError: Si JSON invalide
         
+        Note:
+            Résultat mis en cache par chemin, invalidé si le fichier est
+            modifié (mtime ou taille). Les données retournées sont partagées :
+            ne pas les modifier sur place (voir clear_load_cache()).
+        
         Exemple:
             >>> data = DataLoader.load_json("data/config/app_config.json")
         """
@@ -73,25 +127,78 @@ class DataLoader:
             if not os.path.isabs(filepath):
                 filepath = DataLoader._get_absolute_path(filepath)
             
-            # Vérifier existence
-            if not os.path.exists(filepath):
+            # Cache (invalidé si fichier modifié : mtime ou taille).
+            # Un seul open() si pas en cache : pas de test d'existence séparé
+            cached = DataLoader._cache.get(filepath)
+            try:
+                if cached is not None:
+                    st = os.stat(filepath)
+                    if cached[0] == (st.st_mtime_ns, st.st_size):
+                        return cached[1]
+                
+                with open(filepath, 'rb') as f:
+                    st = os.fstat(f.fileno())
+                    
+                    # Gros fichier : orjson lit directement la projection mmap
+                    if orjson is not None and st.st_size > _MMAP_THRESHOLD:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            with memoryview(mm) as view:
+                                data = orjson.loads(view)
+                    else:
+                        raw = f.read()
+                        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            except FileNotFoundError:
                 raise FileNotFoundError(
                     f"Fichier non trouvé : {filepath}"
-                )
+                ) from None
             
-            # Charger JSON
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Une seule fois par fichier (chemin non caché)
+            data = _intern_tree(data)
             
+            signature = (st.st_mtime_ns, st.st_size)
+            DataLoader._cache[filepath] = (signature, data)
             return data
         
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError en hérite
             raise json.JSONDecodeError(
                 f"Erreur JSON : {filepath}\n{e.msg}",
                 e.doc,
                 e.pos
             )
     
+    @staticmethod
+    def clear_load_cache():
+        """Vider le cache des fichiers JSON chargés (force une relecture)"""
+        DataLoader._cache.clear()
+    
+    @staticmethod
+    def load_json_many(filepaths):
+        """
+        Charger plusieurs fichiers JSON en une fois (lectures en parallèle)
+        
+        Args:
+            filepaths (list): Chemins fichiers (relatifs ou absolus)
+        
+        Returns:
+            list: Données JSON, dans l'ordre des chemins
+        
+        Raises:
+            FileNotFoundError: Si un fichier n'existe pas
+            json.JSONDecodeError: Si un JSON est invalide
+        
+        Exemple:
+            >>> config, rules = DataLoader.load_json_many([
+            ...     DataLoader.DEFAULT_PATHS["config"],
+            ...     DataLoader.DEFAULT_PATHS["validation_rules"]
+            ... ])
+        """
+        filepaths = list(filepaths)
+        if len(filepaths) <= 1:
+            return [DataLoader.load_json(path) for path in filepaths]
+        
+        with ThreadPoolExecutor(max_workers=min(32, len(filepaths))) as executor:
+            return list(executor.map(DataLoader.load_json, filepaths))
+    
     @staticmethod
     def load_config(use_complet=True):
         """
@@ -107,9 +214,7 @@ class DataLoader:
             FileNotFoundError: Si fichier non trouvé
         """
         key = "config_complet" if use_complet else "config"
-        path = DataLoader.DEFAULT_PATHS[key]
-        
-        return DataLoader.load_json(path)
+        return DataLoader.load_json(DataLoader.DEFAULT_PATHS[key])
     
     @staticmethod
     def load_validation_rules(use_complet=True):
@@ -123,9 +228,7 @@ class DataLoader:
             dict: Règles validation
         """
         key = "validation_rules_complet" if use_complet else "validation_rules"
-        path = DataLoader.DEFAULT_PATHS[key]
-        
-        return DataLoader.load_json(path)
+        return DataLoader.load_json(DataLoader.DEFAULT_PATHS[key])
     
     @staticmethod
     def load_checklist_template(use_complet=True):
@@ -143,9 +246,7 @@ class DataLoader:
             >>> print(f"Items : {len(checklist['items'])}")
         """
         key = "checklist_template_complet" if use_complet else "checklist_template"
-        path = DataLoader.DEFAULT_PATHS[key]
-        
-        return DataLoader.load_json(path)
+        return DataLoader.load_json(DataLoader.DEFAULT_PATHS[key])
     
     @staticmethod
     def load_medical_vocabulary(use_complet=True):
@@ -163,9 +264,7 @@ class DataLoader:
             >>> print(f"Concepts : {vocab['concepts'].keys()}")
         """
         key = "medical_vocabulary_complet" if use_complet else "medical_vocabulary"
-        path = DataLoader.DEFAULT_PATHS[key]
-        
-        return DataLoader.load_json(path)
+        return DataLoader.load_json(DataLoader.DEFAULT_PATHS[key])
     
     @staticmethod
     def load_patient(patient_id):
@@ -198,8 +297,7 @@ class DataLoader:
         Returns:
             dict: Template patient
         """
-        path = DataLoader.DEFAULT_PATHS["patient_template"]
-        return DataLoader.load_json(path)
+        return DataLoader.load_json(DataLoader.DEFAULT_PATHS["patient_template"])
     
     @staticmethod
     def list_patients():
@@ -214,23 +312,24 @@ class DataLoader:
             >>> print(patients)
             ['P001.json', 'P002.json', 'P003.json']
         """
-        patients_dir = DataLoader.DEFAULT_PATHS["patients_dir"]
-        patients_abs = DataLoader._get_absolute_path(patients_dir)
+        patients_abs = DataLoader.DEFAULT_PATHS["patients_dir"]
         
-        if not os.path.exists(patients_abs):
+        # scandir : type d'entrée fourni par readdir (pas de stat par fichier)
+        try:
+            with os.scandir(patients_abs) as entries:
+                patients = [
+                    entry.name for entry in entries
+                    if entry.name.endswith('.json') and entry.is_file()
+                ]
+        except FileNotFoundError:
             return []
         
-        patients = [
-            f for f in os.listdir(patients_abs)
-            if f.endswith('.json')
-        ]
-        
         return sorted(patients)
     
     @staticmethod
     def load_all_patients():
         """
-        Charger tous les patients
+        Charger tous les patients (lectures en parallèle, threads)
         
         Returns:
             dict: {patient_id: données}
@@ -243,12 +342,24 @@ class DataLoader:
         patients_files = DataLoader.list_patients()
         all_patients = {}
         
-        for filename in patients_files:
-            patient_id = filename.replace('.json', '')
-            try:
-                all_patients[patient_id] = DataLoader.load_patient(patient_id)
-            except Exception as e:
-                print(f"⚠️  Erreur chargement {patient_id} : {e}")
+        if not patients_files:
+            return all_patients
+        
+        patient_ids = [f.replace('.json', '') for f in patients_files]
+        
+        # Lectures I/O (GIL relâché) : un thread par fichier, max 32
+        with ThreadPoolExecutor(max_workers=min(32, len(patient_ids))) as executor:
+            futures = [
+                (patient_id, executor.submit(DataLoader.load_patient, patient_id))
+                for patient_id in patient_ids
+            ]
+            
+            # Ordre trié conservé, erreurs isolées par patient
+            for patient_id, future in futures:
+                try:
+                    all_patients[patient_id] = future.result()
+                except Exception as e:
+                    print(f"⚠️  Erreur chargement {patient_id} : {e}")
         
         return all_patients
     
@@ -272,12 +383,22 @@ class DataLoader:
             if not os.path.isabs(filepath):
                 filepath = DataLoader._get_absolute_path(filepath)
             
-            # Créer dossier si nécessaire
-            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            # Créer dossier si nécessaire (vérifié à chaque écriture : un
+            # dossier supprimé entre-temps est recréé)
+            directory = os.path.dirname(filepath)
+            if not os.path.isdir(directory):
+                os.makedirs(directory, exist_ok=True)
             
-            # Sauvegarder
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Sauvegarder (UTF-8 non échappé dans les deux cas)
+            if orjson is not None:
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(
+                        data,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    ))
+            else:
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
         
         except IOError as e:
             raise IOError(f"Erreur écriture {filepath} : {e}")
@@ -295,19 +416,16 @@ class DataLoader:
             >>> for file, exists in status.items():
             ...     print(f"{'✅' if exists else '❌'} {file}")
         """
-        status = {}
+        names = list(DataLoader.DEFAULT_PATHS)
         
-        for name, path in DataLoader.DEFAULT_PATHS.items():
-            if name.endswith("_dir"):
-                # Vérifier dossier
-                abs_path = DataLoader._get_absolute_path(path)
-                status[name] = os.path.isdir(abs_path)
-            else:
-                # Vérifier fichier
-                abs_path = DataLoader._get_absolute_path(path)
-                status[name] = os.path.isfile(abs_path)
+        # Dossiers (*_dir) : isdir, sinon isfile
+        def check(name):
+            path = DataLoader.DEFAULT_PATHS[name]
+            return (os.path.isdir if name.endswith("_dir") else os.path.isfile)(path)
         
-        return status
+        # stat() en parallèle (utile sur FS froid / réseau)
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            return dict(zip(names, executor.map(check, names)))
 
 
 # Exemple d'utilisation
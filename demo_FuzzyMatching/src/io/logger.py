@@ -8,12 +8,123 @@ Module pour gérer les logs :
 - Format standardisé
 """
 
+import atexit
+import functools
 import logging
 import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
 
 
+class _TargetQueueHandler(QueueHandler):
+    """
+    QueueHandler qui marque chaque record avec le logger d'origine
+    (le thread d'écriture retrouve ainsi les bons handlers)
+    
+    Thread d'écriture arrêté (sortie du programme) : écriture directe,
+    aucun record n'est perdu
+    """
+    
+    def __init__(self, log_queue, target):
+        super().__init__(log_queue)
+        self.target = target
+    
+    def prepare(self, record):
+        record = super().prepare(record)
+        record.log_target = self.target
+        return record
+    
+    def emit(self, record):
+        with Logger._listener_lock:
+            if Logger._listener is not None:
+                super().emit(record)
+                return
+        try:
+            Logger._router.handle(self.prepare(record))
+        except Exception:
+            self.handleError(record)
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler à tampon large : pas de flush (syscall write) par ligne
+    
+    Flush immédiat pour WARNING et plus ; sinon un timer vide le tampon
+    FLUSH_INTERVAL secondes après la première ligne non écrite (et à
+    l'arrêt via Logger.stop / logging.shutdown)
+    """
+    
+    BUFFER_SIZE = 65536
+    FLUSH_INTERVAL = 0.2
+    
+    def __init__(self, filename, encoding=None):
+        self._flush_timer = None
+        super().__init__(filename, encoding=encoding)
+    
+    def _open(self):
+        return open(
+            self.baseFilename, self.mode,
+            buffering=self.BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors
+        )
+    
+    def _timed_flush(self):
+        """Timer : écrire le tampon (lignes en attente depuis FLUSH_INTERVAL)"""
+        with self.lock:
+            self._flush_timer = None
+            self.flush()
+    
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            
+            if record.levelno >= logging.WARNING:
+                self.flush()
+            elif self._flush_timer is None:
+                # Un seul timer en attente par handler (emit appelé sous self.lock)
+                self._flush_timer = threading.Timer(self.FLUSH_INTERVAL, self._timed_flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def close(self):
+        with self.lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        super().close()
+
+
+class _RoutingHandler(logging.Handler):
+    """
+    Handler du thread d'écriture : renvoie chaque record vers les
+    handlers console/fichier de son logger d'origine
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.targets = {}  # {nom logger: [handlers]}
+    
+    def handle(self, record):
+        for handler in self.targets.get(getattr(record, "log_target", None), ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+    
+    def emit(self, record):
+        self.handle(record)
+
+
 class Logger:
     """
     Gère le logging de l'application
@@ -22,15 +133,57 @@ class Logger:
     
     _loggers = {}  # Cache des loggers créés
     
+    # Écritures fichier déportées sur un thread (QueueListener) ; la
+    # console reste synchrone (ordre conservé avec l'interface print)
+    _queue = None
+    _router = None
+    _listener = None
+    _listener_lock = threading.Lock()
+    
     # Répertoire logs
     LOGS_DIR = "logs"
     
+    # Chemin logs résolu une fois, dossier créé au premier besoin seulement
+    _logs_path = Path(__file__).parent.parent.parent / LOGS_DIR
+    _logs_dir_ready = False
+    
     @staticmethod
     def _ensure_logs_dir():
-        """Créer dossier logs s'il n'existe pas"""
-        logs_path = Path(__file__).parent.parent.parent / Logger.LOGS_DIR
-        logs_path.mkdir(exist_ok=True)
-        return logs_path
+        """Créer dossier logs s'il n'existe pas (un seul mkdir par process)"""
+        if not Logger._logs_dir_ready:
+            Logger._logs_path.mkdir(exist_ok=True)
+            Logger._logs_dir_ready = True
+        return Logger._logs_path
+    
+    @staticmethod
+    def _ensure_listener():
+        """
+        Démarrer (une fois) le thread d'écriture des logs
+        
+        Returns:
+            queue.Queue: File des records à écrire
+        """
+        if Logger._queue is None:
+            Logger._queue = queue.Queue(-1)
+            Logger._router = _RoutingHandler()
+        
+        with Logger._listener_lock:
+            if Logger._listener is None:
+                Logger._listener = QueueListener(Logger._queue, Logger._router)
+                Logger._listener.start()
+        return Logger._queue
+    
+    @staticmethod
+    def stop():
+        """Vider la file et arrêter le thread d'écriture (appelé à la sortie)"""
+        # Records émis ensuite : écrits directement (voir _TargetQueueHandler)
+        with Logger._listener_lock:
+            listener, Logger._listener = Logger._listener, None
+        if listener is not None:
+            listener.stop()
+        
+        # Écrire les tampons fichiers restants
+        Logger.flush()
     
     @staticmethod
     def get_logger(name, level=logging.INFO, to_file=True):
@@ -49,9 +202,10 @@ class Logger:
             >>> logger = Logger.get_logger("core.recognizer")
             >>> logger.info("Message")
         """
-        # Retourner logger existant si déjà créé
-        if name in Logger._loggers:
-            return Logger._loggers[name]
+        # Retourner logger existant si déjà créé (une seule recherche)
+        logger = Logger._loggers.get(name)
+        if logger is not None:
+            return logger
         
         # Créer nouveau logger
         logger = logging.getLogger(name)
@@ -63,58 +217,83 @@ class Logger:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         
-        # Handler console
+        # Handler console (synchrone : lignes dans l'ordre des print())
         console_handler = logging.StreamHandler()
         console_handler.setLevel(level)
         console_handler.setFormatter(formatter)
         logger.addHandler(console_handler)
         
         # Handler fichier (optionnel)
+        handlers = []
+        file_error = None
         if to_file:
             try:
                 logs_path = Logger._ensure_logs_dir()
                 log_file = logs_path / f"{name.replace('.', '_')}.log"
                 
-                file_handler = logging.FileHandler(log_file, encoding='utf-8')
+                file_handler = _BufferedFileHandler(log_file, encoding='utf-8')
                 file_handler.setLevel(level)
                 file_handler.setFormatter(formatter)
-                logger.addHandler(file_handler)
+                handlers.append(file_handler)
             except Exception as e:
-                logger.warning(f"Impossible créer log fichier : {e}")
+                file_error = e
+        
+        # Fichier : le thread appelant ne fait qu'empiler, écriture sur le
+        # thread listener
+        if handlers:
+            log_queue = Logger._ensure_listener()
+            Logger._router.targets[name] = handlers
+            queue_handler = _TargetQueueHandler(log_queue, name)
+            queue_handler.setLevel(level)
+            logger.addHandler(queue_handler)
+        
+        if file_error is not None:
+            logger.warning(f"Impossible créer log fichier : {file_error}")
         
         # Cacher logger
         Logger._loggers[name] = logger
         
         return logger
     
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _default_logger(name):
+        """
+        Logger par défaut (niveau INFO, fichier) mis en cache par nom
+        
+        Chemin rapide des raccourcis debug()/info()/... : une recherche
+        de cache C au lieu de l'appel complet à get_logger().
+        """
+        return Logger.get_logger(name)
+    
     @staticmethod
     def debug(message, logger_name="app"):
         """Log DEBUG"""
-        logger = Logger.get_logger(logger_name)
+        logger = Logger._default_logger(logger_name)
         logger.debug(message)
     
     @staticmethod
     def info(message, logger_name="app"):
         """Log INFO"""
-        logger = Logger.get_logger(logger_name)
+        logger = Logger._default_logger(logger_name)
         logger.info(message)
     
     @staticmethod
     def warning(message, logger_name="app"):
         """Log WARNING"""
-        logger = Logger.get_logger(logger_name)
+        logger = Logger._default_logger(logger_name)
         logger.warning(message)
     
     @staticmethod
     def error(message, logger_name="app"):
         """Log ERROR"""
-        logger = Logger.get_logger(logger_name)
+        logger = Logger._default_logger(logger_name)
         logger.error(message)
     
     @staticmethod
     def critical(message, logger_name="app"):
         """Log CRITICAL"""
-        logger = Logger.get_logger(logger_name)
+        logger = Logger._default_logger(logger_name)
         logger.critical(message)
     
     @staticmethod
@@ -126,10 +305,11 @@ class Logger:
             >>> Logger.log_section("DÉMARRAGE CHECKLIST")
             # → "============ DÉMARRAGE CHECKLIST ============"
         """
-        logger = Logger.get_logger(logger_name)
+        logger = Logger._default_logger(logger_name)
         separator = "=" * (len(title) + 4)
+        # Un record par ligne (préfixe horodaté sur chaque ligne du fichier)
         logger.info(separator)
-        logger.info(f"  {title}")
+        logger.info("  %s", title)
         logger.info(separator)
     
     @staticmethod
@@ -147,7 +327,7 @@ class Logger:
             >>> # ... exécution ...
             >>> Logger.log_execution("run_checklist", "end", 12.5)
         """
-        logger = Logger.get_logger("app.execution")
+        logger = Logger._default_logger("app.execution")
         
         if status == "start":
             logger.info(f"▶️  Démarrage {func_name}")
@@ -168,11 +348,29 @@ class Logger:
             recognized (str): Texte reconnu
             status (str): "VALIDÉ" ou "ÉCHOUÉ"
             score (int): Score (%)
+        
+        Note:
+            Un record par validation, horodaté à l'appel (trace d'audit)
         """
-        logger = Logger.get_logger("app.validation")
+        logger = Logger._default_logger("app.validation")
         icon = "✅" if "VALIDÉ" in status else "❌"
         logger.info(f"{icon} Item {item_id}: '{recognized}' - {status} ({score}%)")
     
+    @staticmethod
+    def flush():
+        """
+        Écrire sur disque les tampons des fichiers de log
+        
+        Exemple:
+            >>> Logger.log_validation(1, "marie dupont", "VALIDÉ", 100)
+            >>> Logger.flush()
+        """
+        if Logger._router is None:
+            return
+        for handlers in list(Logger._router.targets.values()):
+            for handler in handlers:
+                handler.flush()
+    
     @staticmethod
     def clear_old_logs(days=7):
         """
@@ -185,15 +383,23 @@ class Logger:
             logs_path = Logger._ensure_logs_dir()
             cutoff_time = datetime.now().timestamp() - (days * 24 * 3600)
             
-            for log_file in logs_path.glob("*.log"):
-                if log_file.stat().st_mtime < cutoff_time:
-                    log_file.unlink()
-                    Logger.info(f"Supprimé ancien log : {log_file.name}")
+            # scandir : nom sans stat ; DirEntry.stat() fait un appel système au
+            # premier appel sous Linux/macOS (infos du parcours réutilisées sous Windows)
+            with os.scandir(logs_path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".log") and entry.stat().st_mtime < cutoff_time:
+                        os.unlink(entry.path)
+                        Logger.info(f"Supprimé ancien log : {entry.name}")
         
         except Exception as e:
             Logger.warning(f"Erreur suppression logs : {e}")
 
 
+# Arrêt propre à la sortie, enregistré dès l'import (records déjà émis
+# écrits même si aucun logger fichier n'a démarré le thread)
+atexit.register(Logger.stop)
+
+
 # Exemple d'utilisation
 if __name__ == "__main__":
     print("=== Logger Tests ===\n")
@@ -4,12 +4,78 @@ main.py - Point d'entrée de l'application
 Orchestre l'exécution complète de l'application checklist vocale
 """
 
+import os
 import sys
 import time
-from io.data_loader import DataLoader
-from core import ChecklistRecognizer, Validator, ChecklistManager
-from ui.display import Display
-from ui.menus import MainMenu
+from concurrent.futures import ThreadPoolExecutor
+
+# Racine projet sur sys.path : imports qualifiés src.* (un import "io.*"
+# tomberait sur le module standard io, déjà chargé par Python)
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+from src.io.data_loader import DataLoader
+from src.io.logger import Logger
+from src.ui.display import Display
+
+# src.core (Vosk, sounddevice, rapidfuzz) est importé par initialize_manager(),
+# appelé par run() avant le menu : seuls la bannière et le chargement de la
+# configuration s'exécutent sans ces librairies
+
+
+# ============================================================================
+# TEXTES FIXES (construits une fois)
+# ============================================================================
+
+_SEP = "=" * 60
+
+_MAIN_MENU_TEXT = (
+    f"\n{_SEP}\n"
+    "  📋 MENU PRINCIPAL\n"
+    f"{_SEP}\n"
+    "\n  1️⃣  Exécuter la checklist complète\n"
+    "  2️⃣  Tester un item spécifique\n"
+    "  3️⃣  Changer de patient\n"
+    "  4️⃣  Voir infos patient\n"
+    "  5️⃣  À propos\n"
+    "  0️⃣  QUITTER\n"
+)
+
+_PATIENT_INFO_HEADER = f"\n{_SEP}\n  👤 INFORMATIONS PATIENT\n{_SEP}"
+
+_ABOUT_HEADER = f"\n{_SEP}\n  ℹ️  À PROPOS\n{_SEP}"
+
+_ABOUT_TEXT = """
+  VERSION : 2.0
+  
+  Technologie :
+    • Vosk (Reconnaissance vocale offline)
+    • spaCy (Traitement NLP français)
+    • rapidfuzz (Fuzzy matching)
+    • Python 3.7+
+  
+  Fonctionnalités :
+    ✓ Reconnaissance vocale 100% offline
+    ✓ Audio traité uniquement lors des questions
+    ✓ Validation fuzzy matching + NLP avancé
+    ✓ Support vocabulaire médical français
+    ✓ Conforme RGPD - données 100% locales
+    ✓ 9 items checklist chirurgicale
+  
+  Auteur : Développé pour application médicale
+  
+  Dépendances :
+    • sounddevice
+    • vosk
+    • rapidfuzz
+    • spacy
+  
+  Architecture :
+    • Données séparées du code
+    • Configuration centralisée
+    • Code modulaire et testable
+        """
 
 
 class Application:
@@ -25,6 +91,19 @@ class Application:
         self.checklist_template = None
         self.medical_vocabulary = None
         self.manager = None
+        
+        # Managers déjà construits, par ID patient (changement de patient instantané)
+        self._manager_cache = {}
+        
+        # Menu principal : choix -> action (table construite une fois)
+        self._menu_actions = {
+            "0": self.exit_application,
+            "1": self.run_full_checklist,
+            "2": self.run_single_item,
+            "3": self.change_patient,
+            "4": self.show_patient_info,
+            "5": self.show_about
+        }
     
     def load_configuration(self):
         """
@@ -37,21 +116,28 @@ class Application:
         try:
             print("⚙️  Chargement configuration...\n")
             
-            # Charger config app
-            self.config = DataLoader.load_config()
-            print("✅ Configuration app")
-            
-            # Charger template checklist
-            self.checklist_template = DataLoader.load_checklist_template()
-            print("✅ Template checklist")
-            
-            # Charger vocabulaire médical
-            self.medical_vocabulary = DataLoader.load_medical_vocabulary()
-            print("✅ Vocabulaire médical")
-            
-            # Charger patient par défaut
-            self.patient = DataLoader.load_patient("P001")
-            print("✅ Données patient\n")
+            # Lectures indépendantes : lancées en parallèle (durée = la plus longue)
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                config_future = executor.submit(DataLoader.load_config)
+                template_future = executor.submit(DataLoader.load_checklist_template)
+                vocabulary_future = executor.submit(DataLoader.load_medical_vocabulary)
+                patient_future = executor.submit(DataLoader.load_patient, "P001")
+                
+                # Charger config app
+                self.config = config_future.result()
+                print("✅ Configuration app")
+                
+                # Charger template checklist
+                self.checklist_template = template_future.result()
+                print("✅ Template checklist")
+                
+                # Charger vocabulaire médical
+                self.medical_vocabulary = vocabulary_future.result()
+                print("✅ Vocabulaire médical")
+                
+                # Charger patient par défaut
+                self.patient = patient_future.result()
+                print("✅ Données patient\n")
             
         except FileNotFoundError as e:
             print(f"❌ ERREUR : Fichier non trouvé\n{e}")
@@ -61,13 +147,26 @@ class Application:
             sys.exit(1)
     
     def initialize_manager(self):
-        """Initialiser le manager checklist"""
+        """
+        Initialiser le manager checklist
+        
+        Note:
+            Réutilise le manager déjà construit pour ce patient, tant que
+            ses données n'ont pas été rechargées (DataLoader renvoie le
+            même objet si le fichier n'a pas changé)
+        """
         try:
-            self.manager = ChecklistManager(
-                self.checklist_template,
-                self.patient,
-                self.config
-            )
+            patient_id = self.patient.get('id')
+            manager = self._manager_cache.get(patient_id)
+            if manager is None or manager.patient is not self.patient:
+                from src.core import ChecklistManager
+                manager = ChecklistManager.from_config(
+                    self.checklist_template,
+                    self.patient,
+                    self.config
+                )
+                self._manager_cache[patient_id] = manager
+            self.manager = manager
         except Exception as e:
             print(f"❌ ERREUR initialisation : {e}")
             sys.exit(1)
@@ -82,38 +181,17 @@ class Application:
     def show_main_menu(self):
         """Afficher et gérer le menu principal"""
         while True:
+            # Écrire les logs fichier en attente avant de changer d'écran
+            Logger.flush()
             Display.clear_screen()
             
-            print("\n" + "="*60)
-            print("  📋 MENU PRINCIPAL")
-            print("="*60)
-            print("\n  1️⃣  Exécuter la checklist complète")
-            print("  2️⃣  Tester un item spécifique")
-            print("  3️⃣  Changer de patient")
-            print("  4️⃣  Voir infos patient")
-            print("  5️⃣  À propos")
-            print("  0️⃣  QUITTER\n")
+            print(_MAIN_MENU_TEXT)
             
             choice = input("  ➡️  Votre choix (0-5) : ").strip()
             
-            if choice == "0":
-                self.exit_application()
-            
-            elif choice == "1":
-                self.run_full_checklist()
-            
-            elif choice == "2":
-                self.run_single_item()
-            
-            elif choice == "3":
-                self.change_patient()
-            
-            elif choice == "4":
-                self.show_patient_info()
-            
-            elif choice == "5":
-                self.show_about()
-            
+            action = self._menu_actions.get(choice)
+            if action is not None:
+                action()
             else:
                 print("  ❌ Choix invalide, réessayez")
                 time.sleep(1)
@@ -215,21 +293,20 @@ class Application:
         """Afficher infos patient"""
         Display.clear_screen()
         
-        print("\n" + "="*60)
-        print("  👤 INFORMATIONS PATIENT")
-        print("="*60)
+        print(_PATIENT_INFO_HEADER)
         
         print(f"\n  Nom : {self.patient.get('nom', '?')} {self.patient.get('prenom', '?')}")
         print(f"  ID Patient : {self.patient.get('id', '?')}")
         print(f"  DPI : {self.patient.get('numero_dpi', '?')}")
         print(f"  Date naissance : {self.patient.get('date_naissance', '?')}")
         
-        print(f"\n  Intervention : {self.patient.get('operation', {}).get('type_intervention', '?')}")
-        print(f"  Site : {self.patient.get('operation', {}).get('site_operatoire', '?')}")
-        print(f"  Côté : {self.patient.get('operation', {}).get('cote', '?')}")
-        print(f"  Date prévue : {self.patient.get('operation', {}).get('date_prevue', '?')}")
-        print(f"  Chirurgien : {self.patient.get('operation', {}).get('chirurgien', '?')}")
-        print(f"  Anesthésiste : {self.patient.get('operation', {}).get('anesthesiste', '?')}")
+        operation = self.patient.get('operation') or {}
+        print(f"\n  Intervention : {operation.get('type_intervention', '?')}")
+        print(f"  Site : {operation.get('site_operatoire', '?')}")
+        print(f"  Côté : {operation.get('cote', '?')}")
+        print(f"  Date prévue : {operation.get('date_prevue', '?')}")
+        print(f"  Chirurgien : {operation.get('chirurgien', '?')}")
+        print(f"  Anesthésiste : {operation.get('anesthesiste', '?')}")
         
         print()
         input("Appuyez Entrée pour continuer...")
@@ -238,45 +315,15 @@ class Application:
         """Afficher À propos"""
         Display.clear_screen()
         
-        print("\n" + "="*60)
-        print("  ℹ️  À PROPOS")
-        print("="*60)
+        print(_ABOUT_HEADER)
         
-        print("""
-  VERSION : 2.0
-  
-  Technologie :
-    • Vosk (Reconnaissance vocale offline)
-    • spaCy (Traitement NLP français)
-    • rapidfuzz (Fuzzy matching)
-    • Python 3.7+
-  
-  Fonctionnalités :
-    ✓ Reconnaissance vocale 100% offline
-    ✓ Micro activé uniquement lors des questions
-    ✓ Validation fuzzy matching + NLP avancé
-    ✓ Support vocabulaire médical français
-    ✓ Conforme RGPD - données 100% locales
-    ✓ 9 items checklist chirurgicale
-  
-  Auteur : Développé pour application médicale
-  
-  Dépendances :
-    • sounddevice
-    • vosk
-    • rapidfuzz
-    • spacy
-  
-  Architecture :
-    • Données séparées du code
-    • Configuration centralisée
-    • Code modulaire et testable
-        """)
+        print(_ABOUT_TEXT)
         
         input("Appuyez Entrée pour continuer...")
     
     def exit_application(self):
         """Quitter l'application"""
+        Logger.flush()
         Display.clear_screen()
         print("\n  👋 Au revoir !\n")
         sys.exit(0)
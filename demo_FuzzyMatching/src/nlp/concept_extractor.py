@@ -8,9 +8,17 @@ Module pour extraire concepts médicaux du texte :
 - Validation multi-catégories
 """
 
+import re
+import sys
+
 from .normalizer import TextNormalizer
 from .keyword_detector import KeywordDetector
 
+try:
+    import ahocorasick  # pyahocorasick (optionnel)
+except ImportError:
+    ahocorasick = None
+
 
 class ConceptExtractor:
     """
@@ -22,8 +30,225 @@ class ConceptExtractor:
         """Initialiser l'extracteur"""
         self.normalizer = TextNormalizer()
         self.keyword_detector = KeywordDetector()
+        
+        # Vocabulaire pré-normalisé : {tuple(termes): [(terme, normalisé)]}
+        self._vocab_cache = {}
+        
+        # Automates Aho-Corasick par liste de termes : {tuple(termes): automate}
+        self._automaton_cache = {}
+        
+        # Repli sans pyahocorasick : {tuple(termes): regex alternation}
+        self._regex_cache = {}
     
-    def extract_concepts(self, text, concepts_dict, required_concepts=None):
+    def _get_categories(self, concepts_dict, required_concepts):
+        """
+        Récupérer les catégories à parcourir, clés internées
+        
+        Les clés internées sont les mêmes objets que celles du vocabulaire
+        (chargé par DataLoader) : les accès dict se résolvent par identité.
+        Recalculé à chaque appel (quelques clés) : un vocabulaire modifié
+        est toujours pris en compte.
+        
+        Args:
+            concepts_dict (dict): Dictionnaire concepts
+            required_concepts (list): Concepts à chercher (None = tous)
+        
+        Returns:
+            tuple: Catégories présentes dans concepts_dict, dans l'ordre demandé
+        """
+        names = concepts_dict.keys() if required_concepts is None else required_concepts
+        return tuple(
+            sys.intern(category) if type(category) is str else category
+            for category in names
+            if category in concepts_dict
+        )
+    
+    @staticmethod
+    def _terms_key(terms):
+        """
+        Clé de cache d'une liste de termes (contenu, pas identité d'objet)
+        
+        Args:
+            terms (list|dict): Termes, ou structure {'termes': [...]}
+        
+        Returns:
+            tuple: Termes de la liste, dans l'ordre
+        """
+        raw_terms = terms.get("termes", []) if isinstance(terms, dict) else terms
+        return tuple(raw_terms)
+    
+    @staticmethod
+    def _cache_store(cache, key, value):
+        """
+        Stocker une entrée dans un cache borné (vidé à 128 entrées)
+        
+        Args:
+            cache (dict): Cache à alimenter
+            key (tuple): Clé (voir _terms_key)
+            value: Valeur à stocker
+        
+        Returns:
+            value: La valeur stockée
+        """
+        if len(cache) >= 128:
+            cache.clear()
+        cache[key] = value
+        return value
+    
+    def _get_normalized_terms(self, terms):
+        """
+        Récupérer les termes d'une catégorie avec leur forme normalisée
+        
+        Chaque liste de termes n'est normalisée qu'une fois (cache par
+        contenu : une liste modifiée est renormalisée).
+        
+        Args:
+            terms (list|dict): Termes, ou structure {'termes': [...]}
+        
+        Returns:
+            list: [(terme original, terme normalisé), ...]
+        """
+        key = self._terms_key(terms)
+        pairs = self._vocab_cache.get(key)
+        if pairs is not None:
+            return pairs
+        
+        pairs = [(term, self.normalizer.normalize(term)) for term in key]
+        return self._cache_store(self._vocab_cache, key, pairs)
+    
+    def _get_automaton(self, terms):
+        """
+        Récupérer l'automate Aho-Corasick d'une liste de termes (construit une fois)
+        
+        Args:
+            terms (list|dict): Termes, ou structure {'termes': [...]}
+        
+        Returns:
+            ahocorasick.Automaton: Automate {terme normalisé: [indices]},
+            ou None si aucun terme non vide
+        """
+        key = self._terms_key(terms)
+        if key in self._automaton_cache:
+            return self._automaton_cache[key]
+        
+        automaton = ahocorasick.Automaton()
+        for idx, (_, term_norm) in enumerate(self._get_normalized_terms(terms)):
+            if not term_norm:
+                continue
+            if term_norm in automaton:
+                automaton.get(term_norm).append(idx)
+            else:
+                automaton.add_word(term_norm, [idx])
+        
+        if len(automaton) == 0:
+            automaton = None
+        else:
+            automaton.make_automaton()
+        
+        return self._cache_store(self._automaton_cache, key, automaton)
+    
+    def _get_regex(self, terms):
+        """
+        Récupérer la regex alternation d'une liste de termes (compilée une fois)
+        
+        Args:
+            terms (list|dict): Termes, ou structure {'termes': [...]}
+        
+        Returns:
+            re.Pattern: Regex (lookahead, termes les plus longs d'abord),
+            ou None si aucun terme non vide
+        """
+        key = self._terms_key(terms)
+        if key in self._regex_cache:
+            return self._regex_cache[key]
+        
+        terms_norm = {term_norm for _, term_norm in self._get_normalized_terms(terms) if term_norm}
+        pattern = None
+        if terms_norm:
+            alternation = '|'.join(
+                re.escape(term_norm)
+                for term_norm in sorted(terms_norm, key=len, reverse=True)
+            )
+            # Lookahead : une correspondance possible à chaque position
+            pattern = re.compile(f"(?=({alternation}))")
+        
+        return self._cache_store(self._regex_cache, key, pattern)
+    
+    def _find_terms(self, text_norm, terms, limit=None):
+        """
+        Trouver les termes d'une catégorie présents dans le texte normalisé
+        
+        Args:
+            text_norm (str): Texte normalisé
+            terms (list|dict): Termes, ou structure {'termes': [...]}
+            limit (int): Arrêter dès que limit termes sont trouvés (optionnel)
+        
+        Returns:
+            list: Termes originaux trouvés (ordre du vocabulaire),
+            au plus limit termes
+        
+        Note:
+            Avec pyahocorasick : un seul parcours du texte pour tous les
+            termes ; sinon une seule regex alternation (moteur re en C)
+        """
+        pairs = self._get_normalized_terms(terms)
+        
+        if ahocorasick is None:
+            pattern = self._get_regex(terms)
+            matched = set(pattern.findall(text_norm)) if pattern is not None else set()
+            
+            # Terme préfixe d'un terme plus long trouvé à la même position :
+            # il est contenu dans ce match
+            found = [
+                term for term, term_norm in pairs
+                if not term_norm or any(term_norm in hit for hit in matched)
+            ]
+            return found if limit is None else found[:limit]
+        
+        hits = set()
+        automaton = self._get_automaton(terms)
+        if automaton is not None:
+            for _, indices in automaton.iter(text_norm):
+                hits.update(indices)
+                if limit is not None and len(hits) >= limit:
+                    break
+        
+        # Terme vide : toujours contenu (comme l'opérateur in)
+        found = [
+            term for idx, (term, term_norm) in enumerate(pairs)
+            if idx in hits or not term_norm
+        ]
+        return found if limit is None else found[:limit]
+    
+    def _find_whole_words(self, text_norm, terms):
+        """
+        Trouver les termes présents en mots entiers (index de n-grammes)
+        
+        Args:
+            text_norm (str): Texte normalisé
+            terms (list|dict): Termes, ou structure {'termes': [...]}
+        
+        Returns:
+            list: Termes originaux trouvés (ordre du vocabulaire)
+        
+        Exemple:
+            "genou gauche" trouve "genou" et "genou gauche", mais pas "nou"
+        """
+        pairs = self._get_normalized_terms(terms)
+        tokens = text_norm.split()
+        
+        # n-grammes du texte, jusqu'à la longueur (en mots) du plus long terme
+        max_words = max((len(term_norm.split()) for _, term_norm in pairs), default=0)
+        ngrams = set()
+        for n in range(1, min(max_words, len(tokens)) + 1):
+            ngrams.update(
+                " ".join(tokens[i:i + n])
+                for i in range(len(tokens) - n + 1)
+            )
+        
+        return [term for term, term_norm in pairs if term_norm in ngrams]
+    
+    def extract_concepts(self, text, concepts_dict, required_concepts=None, early_stop=None):
         """
         Extraire concepts du texte
         
@@ -33,6 +258,9 @@ class ConceptExtractor:
                                   {"risques": [...], "traitements": [...]}
             required_concepts (list): Concepts à chercher (optionnel)
                                      Si None, cherche tous les concepts
+            early_stop (dict): Arrêt anticipé par catégorie (optionnel)
+                               {"risques": 1} : le parcours de "risques"
+                               s'arrête dès 1 terme trouvé
         
         Returns:
             dict:
@@ -67,31 +295,19 @@ class ConceptExtractor:
         # Normaliser texte
         text_norm = self.normalizer.normalize(text)
         
-        # Déterminer quels concepts chercher
-        if required_concepts is None:
-            required_concepts = list(concepts_dict.keys())
+        # Déterminer quels concepts chercher (clés internées, filtrées une fois)
+        categories = self._get_categories(concepts_dict, required_concepts)
         
         # Extraire concepts
         concepts_found = {}
         details = {}
         total_score = 0
         
-        for concept_category in required_concepts:
-            if concept_category not in concepts_dict:
-                continue
-            
-            # Chercher termes de cette catégorie
+        for concept_category in categories:
+            # Chercher termes de cette catégorie (liste ou {'termes': [...]})
             terms = concepts_dict[concept_category]
-            
-            if isinstance(terms, dict):
-                # Cas où les termes sont dans une structure {'termes': [...]}
-                terms = terms.get("termes", [])
-            
-            found_terms = []
-            for term in terms:
-                term_norm = self.normalizer.normalize(term)
-                if term_norm in text_norm:
-                    found_terms.append(term)
+            limit = early_stop.get(concept_category) if early_stop else None
+            found_terms = self._find_terms(text_norm, terms, limit)
             
             if found_terms:
                 concepts_found[concept_category] = found_terms
@@ -99,7 +315,7 @@ class ConceptExtractor:
             
             details[concept_category] = {
                 "found": len(found_terms),
-                "total": len(terms),
+                "total": len(self._get_normalized_terms(terms)),
                 "terms": found_terms
             }
         
@@ -111,13 +327,17 @@ class ConceptExtractor:
             "text_normalized": text_norm
         }
     
-    def extract_category(self, text, category_terms):
+    def extract_category(self, text, category_terms, whole_words=False):
         """
         Extraire termes d'une catégorie spécifique
         
         Args:
             text (str): Texte
             category_terms (list): Termes de la catégorie
+            whole_words (bool): Mots entiers uniquement ? (défaut: non,
+                                recherche sous-chaîne). Si oui, le texte est
+                                indexé une fois en ensembles de n-grammes de
+                                mots : chaque terme = une recherche O(1)
         
         Returns:
             dict:
@@ -133,12 +353,11 @@ class ConceptExtractor:
             ['hypothermie', 'allergie']
         """
         text_norm = self.normalizer.normalize(text)
-        found = []
         
-        for term in category_terms:
-            term_norm = self.normalizer.normalize(term)
-            if term_norm in text_norm:
-                found.append(term)
+        if whole_words:
+            found = self._find_whole_words(text_norm, category_terms)
+        else:
+            found = self._find_terms(text_norm, category_terms)
         
         return {
             "found": found,
@@ -179,6 +398,7 @@ class ConceptExtractor:
             >>> result['valid']
             True
         """
+        # Pas d'arrêt anticipé : concepts et détails retournés complets
         extraction = self.extract_concepts(
             text,
             concepts_dict,
@@ -265,6 +485,11 @@ class ConceptExtractor:
         return f"{parts[0]} ({', '.join(parts[1:])})"
 
 
+# Instance partagée : caches vocabulaire/automates communs aux appelants,
+# à importer plutôt que de construire un extracteur par appel
+default = ConceptExtractor()
+
+
 # Exemple d'utilisation
 if __name__ == "__main__":
     extractor = ConceptExtractor()
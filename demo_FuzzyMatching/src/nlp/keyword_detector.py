@@ -8,8 +8,17 @@ Module pour détecter mots-clés et expressions dans le texte :
 - Détection phrases clés
 """
 
+import sys
+from collections import OrderedDict
+
 from .normalizer import TextNormalizer
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
+from rapidfuzz.distance import Levenshtein
+
+try:
+    import ahocorasick  # pyahocorasick (optionnel)
+except ImportError:
+    ahocorasick = None
 
 
 class KeywordDetector:
@@ -17,17 +26,190 @@ class KeywordDetector:
     Détecte mots-clés et expressions dans le texte
     """
     
-    def __init__(self, use_fuzzy=False, fuzzy_threshold=80):
+    # Nombre max de listes de mots-clés normalisées gardées en cache
+    KEYWORDS_CACHE_SIZE = 128
+    
+    # Scorer "distance d'édition par mot" (voir __init__)
+    WORD_DISTANCE = "levenshtein"
+    
+    def __init__(self, use_fuzzy=False, fuzzy_threshold=80, scorer=None):
         """
         Initialiser le détecteur
         
         Args:
             use_fuzzy (bool): Utiliser fuzzy matching optionnel
             fuzzy_threshold (int): Seuil fuzzy matching (%)
+            scorer: Scorer fuzzy (défaut: fuzz.partial_ratio), ou
+                    KeywordDetector.WORD_DISTANCE : mot-clé d'un seul mot
+                    trouvé si un mot du texte est à au plus
+                    len(mot-clé) * (100 - seuil) / 100 éditions
+                    (Levenshtein borné, bien plus rapide) ; les expressions
+                    de plusieurs mots restent en partial_ratio
         """
         self.use_fuzzy = use_fuzzy
         self.fuzzy_threshold = fuzzy_threshold
+        self.scorer = scorer if scorer is not None else fuzz.partial_ratio
         self.normalizer = TextNormalizer()
+        
+        # Mots-clés normalisés (LRU) :
+        # {tuple(mots-clés): [normalisés, automate Aho-Corasick ou None]}
+        self._kw_cache = OrderedDict()
+    
+    def _get_entry(self, keywords):
+        """
+        Récupérer l'entrée de cache d'une liste de mots-clés
+        
+        Args:
+            keywords (list): Liste de mots-clés
+        
+        Returns:
+            list: [mots-clés normalisés, automate (construit à la demande)]
+        """
+        key = tuple(keywords)
+        entry = self._kw_cache.get(key)
+        if entry is not None:
+            self._kw_cache.move_to_end(key)
+            return entry
+        
+        # Mots-clés normalisés internés : partagés entre listes et détections
+        normalize = self.normalizer.normalize
+        entry = [[sys.intern(normalize(keyword)) for keyword in keywords], None]
+        self._kw_cache[key] = entry
+        if len(self._kw_cache) > KeywordDetector.KEYWORDS_CACHE_SIZE:
+            self._kw_cache.popitem(last=False)
+        return entry
+    
+    def _get_keywords_norm(self, keywords):
+        """
+        Récupérer les mots-clés normalisés (normalisés une fois par liste)
+        
+        Args:
+            keywords (list): Liste de mots-clés
+        
+        Returns:
+            list: Mots-clés normalisés (même ordre)
+        """
+        return self._get_entry(keywords)[0]
+    
+    @staticmethod
+    def _get_automaton(entry):
+        """
+        Récupérer l'automate Aho-Corasick d'une entrée (construit une fois)
+        
+        Args:
+            entry (list): Entrée de cache (voir _get_entry)
+        
+        Returns:
+            ahocorasick.Automaton: Automate {mot-clé normalisé: [indices]}
+            (vide si aucun mot-clé non vide)
+        """
+        automaton = entry[1]
+        if automaton is None:
+            automaton = ahocorasick.Automaton()
+            for idx, keyword_norm in enumerate(entry[0]):
+                if not keyword_norm:
+                    continue
+                if keyword_norm in automaton:
+                    automaton.get(keyword_norm).append(idx)
+                else:
+                    automaton.add_word(keyword_norm, [idx])
+            if len(automaton) > 0:
+                automaton.make_automaton()
+            entry[1] = automaton
+        return automaton
+    
+    def _match_words(self, keywords_norm, text_norm):
+        """
+        Marquer les mots-clés trouvés par distance d'édition mot à mot
+        
+        Args:
+            keywords_norm (list): Mots-clés normalisés
+            text_norm (str): Texte normalisé
+        
+        Returns:
+            list: Booléens, un par mot-clé (même ordre)
+        """
+        tokens = text_norm.split()
+        threshold = self.fuzzy_threshold
+        hits = []
+        
+        for keyword_norm in keywords_norm:
+            if not keyword_norm or " " in keyword_norm:
+                # Expression (ou vide) : partial_ratio sur tout le texte
+                hits.append(fuzz.partial_ratio(text_norm, keyword_norm) >= threshold)
+                continue
+            
+            # Budget d'éditions : extractOne s'arrête dès une distance nulle
+            max_edits = len(keyword_norm) * (100 - threshold) // 100
+            hits.append(process.extractOne(
+                keyword_norm,
+                tokens,
+                scorer=Levenshtein.distance,
+                score_cutoff=max_edits
+            ) is not None)
+        
+        return hits
+    
+    @staticmethod
+    def _match_substrings(entry, text_norm):
+        """
+        Marquer les mots-clés contenus dans le texte normalisé
+        
+        Args:
+            entry (list): Entrée de cache (voir _get_entry)
+            text_norm (str): Texte normalisé
+        
+        Returns:
+            list: Booléens, un par mot-clé (même ordre)
+        
+        Note:
+            Avec pyahocorasick : un seul parcours du texte pour tous les
+            mots-clés (automate construit une fois par liste) ; sinon
+            un test "in" par mot-clé
+        """
+        keywords_norm = entry[0]
+        
+        if ahocorasick is None:
+            return [keyword_norm in text_norm for keyword_norm in keywords_norm]
+        
+        automaton = KeywordDetector._get_automaton(entry)
+        
+        # Mot-clé vide : toujours contenu (comme l'opérateur in)
+        hits = [not keyword_norm for keyword_norm in keywords_norm]
+        if len(automaton) > 0:
+            for _, indices in automaton.iter(text_norm):
+                for idx in indices:
+                    hits[idx] = True
+        return hits
+    
+    def _match(self, entry, text_norm, use_fuzzy):
+        """
+        Marquer les mots-clés trouvés selon la méthode choisie
+        
+        Args:
+            entry (list): Entrée de cache (voir _get_entry)
+            text_norm (str): Texte normalisé
+            use_fuzzy (bool): Fuzzy matching ou sous-chaînes
+        
+        Returns:
+            list: Booléens, un par mot-clé (même ordre ; tableau numpy
+            en fuzzy via cdist)
+        """
+        if use_fuzzy and self.scorer == KeywordDetector.WORD_DISTANCE:
+            return self._match_words(entry[0], text_norm)
+        
+        if use_fuzzy:
+            # Fuzzy matching : tous les mots-clés scorés en un seul appel C
+            scores = process.cdist(
+                [text_norm],
+                entry[0],
+                scorer=self.scorer,
+                score_cutoff=self.fuzzy_threshold
+            )[0]
+            return scores >= self.fuzzy_threshold
+        
+        # Substring matching (exact après normalisation)
+        return self._match_substrings(entry, text_norm)
     
     def detect_keywords(self, text, keywords, fuzzy=None):
         """
@@ -73,23 +255,13 @@ class KeywordDetector:
         # Chercher mots-clés
         found = []
         missing = []
+        hits = self._match(self._get_entry(keywords), text_norm, use_fuzzy)
         
-        for keyword in keywords:
-            keyword_norm = self.normalizer.normalize(keyword)
-            
-            if use_fuzzy:
-                # Fuzzy matching
-                score = fuzz.partial_ratio(text_norm, keyword_norm)
-                if score >= self.fuzzy_threshold:
-                    found.append(keyword)
-                else:
-                    missing.append(keyword)
+        for keyword, hit in zip(keywords, hits):
+            if hit:
+                found.append(keyword)
             else:
-                # Substring matching (exact après normalisation)
-                if keyword_norm in text_norm:
-                    found.append(keyword)
-                else:
-                    missing.append(keyword)
+                missing.append(keyword)
         
         return {
             "found": found,
@@ -99,6 +271,84 @@ class KeywordDetector:
             "text_normalized": text_norm
         }
     
+    def detect_keywords_batch(self, texts, keywords, fuzzy=None):
+        """
+        Détecter mots-clés dans plusieurs textes (même liste de mots-clés)
+        
+        Args:
+            texts (list): Textes à analyser
+            keywords (list): Liste de mots-clés à chercher
+            fuzzy (bool): Utiliser fuzzy matching (override)
+        
+        Returns:
+            list: Un résultat par texte (même format que detect_keywords)
+        
+        Note:
+            Mots-clés normalisés une fois ; en fuzzy, tous les textes sont
+            scorés en un seul appel process.cdist (multi-thread)
+        
+        Exemple:
+            >>> results = detector.detect_keywords_batch(
+            ...     ["oui confirmé", "non"],
+            ...     ["oui", "confirmé"]
+            ... )
+            >>> [r['count'] for r in results]
+            [2, 0]
+        """
+        normalize = self.normalizer.normalize
+        texts_norm = [normalize(text) for text in texts]
+        
+        if not keywords:
+            return [
+                {"found": [], "count": 0, "missing": keywords,
+                 "text": text, "text_normalized": text_norm}
+                for text, text_norm in zip(texts, texts_norm)
+            ]
+        
+        entry = self._get_entry(keywords)
+        use_fuzzy = fuzzy if fuzzy is not None else self.use_fuzzy
+        
+        if use_fuzzy and self.scorer == KeywordDetector.WORD_DISTANCE:
+            rows = [self._match_words(entry[0], text_norm) for text_norm in texts_norm]
+        elif use_fuzzy:
+            # Matrice (textes x mots-clés) en un seul appel C, tous les coeurs
+            scores = process.cdist(
+                texts_norm,
+                entry[0],
+                scorer=self.scorer,
+                score_cutoff=self.fuzzy_threshold,
+                workers=-1
+            )
+            rows = scores >= self.fuzzy_threshold
+        else:
+            rows = [self._match_substrings(entry, text_norm) for text_norm in texts_norm]
+        
+        results = []
+        for text, text_norm, hits in zip(texts, texts_norm, rows):
+            if not text:
+                # Texte vide : rien trouvé (comme detect_keywords)
+                results.append({"found": [], "count": 0, "missing": keywords,
+                                "text": text, "text_normalized": text_norm})
+                continue
+            
+            found = []
+            missing = []
+            for keyword, hit in zip(keywords, hits):
+                if hit:
+                    found.append(keyword)
+                else:
+                    missing.append(keyword)
+            
+            results.append({
+                "found": found,
+                "count": len(found),
+                "missing": missing,
+                "text": text,
+                "text_normalized": text_norm
+            })
+        
+        return results
+    
     def detect_any_keyword(self, text, keywords):
         """
         Détecter AU MOINS UN mot-clé
@@ -116,9 +366,38 @@ class KeywordDetector:
             ...     ["oui", "non", "ok"]
             ... )
             True
+        
+        Note:
+            S'arrête au premier mot-clé trouvé (pas de résultat complet)
         """
-        result = self.detect_keywords(text, keywords)
-        return len(result["found"]) > 0
+        if not text or not keywords:
+            return False
+        
+        text_norm = self.normalizer.normalize(text)
+        entry = self._get_entry(keywords)
+        keywords_norm = entry[0]
+        
+        if self.use_fuzzy and self.scorer == KeywordDetector.WORD_DISTANCE:
+            return any(self._match_words(keywords_norm, text_norm))
+        
+        if self.use_fuzzy:
+            # extractOne s'arrête dès qu'un score parfait est trouvé
+            return process.extractOne(
+                text_norm,
+                keywords_norm,
+                scorer=self.scorer,
+                score_cutoff=self.fuzzy_threshold
+            ) is not None
+        
+        if ahocorasick is None or not all(keywords_norm):
+            return any(keyword_norm in text_norm for keyword_norm in keywords_norm)
+        
+        automaton = self._get_automaton(entry)
+        if len(automaton) > 0:
+            # Première correspondance de l'automate : inutile de continuer
+            for _ in automaton.iter(text_norm):
+                return True
+        return False
     
     def detect_all_keywords(self, text, keywords):
         """
@@ -137,9 +416,24 @@ class KeywordDetector:
             ...     ["oui", "confirmé"]
             ... )
             True
+        
+        Note:
+            S'arrête au premier mot-clé manquant (pas de résultat complet)
         """
-        result = self.detect_keywords(text, keywords)
-        return len(result["missing"]) == 0
+        if not keywords:
+            return True
+        if not text:
+            return False
+        
+        if self.use_fuzzy:
+            result = self.detect_keywords(text, keywords)
+            return len(result["missing"]) == 0
+        
+        text_norm = self.normalizer.normalize(text)
+        return all(
+            keyword_norm in text_norm
+            for keyword_norm in self._get_keywords_norm(keywords)
+        )
     
     def count_keywords(self, text, keywords):
         """
@@ -151,9 +445,17 @@ class KeywordDetector:
         
         Returns:
             int: Nombre trouvé
+        
+        Note:
+            Compte les correspondances sans construire les listes
+            found/missing de detect_keywords
         """
-        result = self.detect_keywords(text, keywords)
-        return result["count"]
+        if not text or not keywords:
+            return 0
+        
+        text_norm = self.normalizer.normalize(text)
+        hits = self._match(self._get_entry(keywords), text_norm, self.use_fuzzy)
+        return int(sum(hits))
     
     def detect_phrases(self, text, phrases):
         """
@@ -167,6 +469,8 @@ class KeywordDetector:
             dict:
                 - found (list): Phrases trouvées
                 - count (int): Nombre trouvé
+                - missing (list): Phrases non trouvées
+                - text (str): Texte original
                 - text_normalized (str): Texte normalisé
         
         Exemple:
@@ -176,8 +480,26 @@ class KeywordDetector:
             ... )
             >>> result['found']
             ['antibio', 'effectuée']
+        
+        Note:
+            Toujours en sous-chaîne exacte (pas de choix fuzzy)
         """
-        return self.detect_keywords(text, phrases, fuzzy=False)
+        text_norm = self.normalizer.normalize(text)
+        
+        if not text or not phrases:
+            found, missing = [], phrases
+        else:
+            hits = self._match_substrings(self._get_entry(phrases), text_norm)
+            found = [phrase for phrase, hit in zip(phrases, hits) if hit]
+            missing = [phrase for phrase, hit in zip(phrases, hits) if not hit]
+        
+        return {
+            "found": found,
+            "count": len(found),
+            "missing": missing,
+            "text": text,
+            "text_normalized": text_norm
+        }
     
     def weighted_detection(self, text, keywords, weights=None):
         """
@@ -205,32 +527,36 @@ class KeywordDetector:
             >>> result['score']
             3
         """
-        if weights is None:
-            weights = {kw: 1 for kw in keywords}
+        # Poids absent = 1 (pas de dict {mot-clé: 1} à construire)
+        get_weight = (weights or {}).get
         
         result = self.detect_keywords(text, keywords)
+        found = result["found"]
         
-        # Calculer score pondéré
-        score = 0
-        details = {}
-        
-        for keyword in result["found"]:
-            weight = weights.get(keyword, 1)
-            score += weight
-            details[keyword] = {"found": True, "weight": weight}
-        
-        for keyword in result["missing"]:
-            weight = weights.get(keyword, 1)
-            details[keyword] = {"found": False, "weight": weight}
+        # Calculer score pondéré (détails : trouvés puis manquants)
+        details = {
+            keyword: {"found": True, "weight": get_weight(keyword, 1)}
+            for keyword in found
+        }
+        score = sum(get_weight(keyword, 1) for keyword in found)
+        details.update(
+            (keyword, {"found": False, "weight": get_weight(keyword, 1)})
+            for keyword in result["missing"]
+        )
         
         return {
-            "found": result["found"],
+            "found": found,
             "score": score,
             "details": details,
             "text_normalized": result["text_normalized"]
         }
 
 
+# Instance partagée (paramètres par défaut) : cache des mots-clés commun
+# aux appelants, à importer plutôt que de construire un détecteur par appel
+default = KeywordDetector()
+
+
 # Exemple d'utilisation
 if __name__ == "__main__":
     detector = KeywordDetector()
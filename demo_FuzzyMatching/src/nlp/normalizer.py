@@ -9,82 +9,164 @@ Module pour normaliser texte reconnu par Vosk avant validation :
 - Suppression termes vides
 """
 
+import functools
 import unicodedata
-import re
 
 
-class TextNormalizer:
+# Mapping accents
+ACCENTS_MAP = {
+    'à': 'a', 'â': 'a', 'ä': 'a', 'á': 'a',
+    'ç': 'c',
+    'é': 'e', 'è': 'e', 'ê': 'e', 'ë': 'e',
+    'î': 'i', 'ï': 'i',
+    'ô': 'o', 'ö': 'o', 'ó': 'o',
+    'ù': 'u', 'û': 'u', 'ü': 'u',
+    'ý': 'y', 'ÿ': 'y'
+}
+
+# Caractères à supprimer
+PUNCTUATION = r'[.,;:!?\'\"-]'
+
+# Apostrophes à standardiser
+APOSTROPHES = ["'", "'", "´", "`"]
+
+
+def _build_latin_table():
     """
-    Normalise le texte pour comparaison et analyse
+    Lettres latines accentuées (U+0080 à U+024F) vers leur lettre ASCII
+    
+    Retenues si leur décomposition NFD est une lettre ASCII suivie de
+    diacritiques combinants uniquement : même résultat que le repli NFD
+    (ñ, ā, É...), mais en une passe str.translate
+    
+    Returns:
+        dict: {code point: lettre ASCII}
+    """
+    table = {}
+    for code in range(0x80, 0x250):
+        decomposed = unicodedata.normalize('NFD', chr(code))
+        base, marks = decomposed[0], decomposed[1:]
+        if (marks and base.isascii() and base.isalpha()
+                and all(unicodedata.combining(mark) for mark in marks)):
+            table[code] = base
+    return table
+
+
+# Tables str.translate (un seul passage C par chaîne) ; ACCENTS_MAP
+# prioritaire sur la table latine calculée
+_ACCENTS_TABLE = {**_build_latin_table(), **str.maketrans(ACCENTS_MAP)}
+
+# Caractères de PUNCTUATION supprimés
+_PUNCT_TABLE = str.maketrans(dict.fromkeys(".,;:!?'\"-"))
+
+# normalize() : accents -> ASCII, ponctuation et apostrophes supprimées
+# (construite depuis ACCENTS_MAP / PUNCTUATION / APOSTROPHES : une
+# variante d'apostrophe ajoutée à la liste est prise en compte)
+_NORMALIZE_TABLE = {
+    **_ACCENTS_TABLE,
+    **_PUNCT_TABLE,
+    **str.maketrans(dict.fromkeys(APOSTROPHES))
+}
+
+# Texte ASCII : caractères supprimés par _NORMALIZE_TABLE (ponctuation,
+# apostrophes) pour bytes.translate, bien plus rapide que str.translate
+_ASCII_DELETE = bytes(
+    code for code, repl in _NORMALIZE_TABLE.items()
+    if code < 128 and repl is None
+)
+
+
+def _strip_marks(text):
     """
+    Supprimer les accents hors ACCENTS_MAP (ñ, õ, ā, É...)
     
-    # Mapping accents
-    ACCENTS_MAP = {
-        'à': 'a', 'â': 'a', 'ä': 'a', 'á': 'a',
-        'ç': 'c',
-        'é': 'e', 'è': 'e', 'ê': 'e', 'ë': 'e',
-        'î': 'i', 'ï': 'i',
-        'ô': 'o', 'ö': 'o', 'ó': 'o',
-        'ù': 'u', 'û': 'u', 'ü': 'u',
-        'ý': 'y', 'ÿ': 'y'
-    }
+    Décomposition canonique NFD (C) puis retrait des signes diacritiques
+    combinants ; les autres caractères non ASCII (œ, €...) sont conservés
     
-    # Caractères à supprimer
-    PUNCTUATION = r'[.,;:!?\'\"-]'
+    Args:
+        text (str): Texte (déjà passé par la table de traduction)
     
-    # Apostrophes à standardiser
-    APOSTROPHES = ["'", "'", "´", "`"]
+    Returns:
+        str: Texte sans diacritiques
+    """
+    return "".join(
+        char for char in unicodedata.normalize('NFD', text)
+        if not unicodedata.combining(char)
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def normalize(text):
+    """
+    Normaliser texte complètement
     
-    @staticmethod
-    def normalize(text):
-        """
-        Normaliser texte complètement
-        
-        Args:
-            text (str): Texte à normaliser
-        
-        Returns:
-            str: Texte normalisé
-        
-        Étapes :
-            1. Vérifier non vide
-            2. Minuscules
-            3. Supprimer accents
-            4. Supprimer ponctuation
-            5. Normaliser espaces
-            6. Supprimer espaces avant/après
-        
-        Exemple:
-            >>> normalizer = TextNormalizer()
-            >>> normalizer.normalize("CHOLÉCYSTECTOMIE!")
-            'cholecystectomie'
-            
-            >>> normalizer.normalize("  Génou   GAUCHE  ,")
-            'genou gauche'
-        """
-        if not text:
-            return ""
-        
-        # 1. Minuscules
-        text = text.lower().strip()
-        
-        # 2. Supprimer accents
-        text = TextNormalizer._remove_accents(text)
-        
-        # 3. Standardiser apostrophes
-        for apostrophe in TextNormalizer.APOSTROPHES:
-            text = text.replace(apostrophe, "'")
-        
-        # 4. Supprimer ponctuation (sauf apostrophes)
-        text = re.sub(TextNormalizer.PUNCTUATION, '', text)
+    Args:
+        text (str): Texte à normaliser
+    
+    Returns:
+        str: Texte normalisé
+    
+    Étapes :
+        1. Vérifier non vide
+        2. Minuscules
+        3. Supprimer accents
+        4. Supprimer ponctuation
+        5. Normaliser espaces
+        6. Supprimer espaces avant/après
+    
+    Note:
+        Fonction module (appelée une fois par mot-clé et par texte), sans
+        lookup d'attribut de classe. Aussi exposée comme
+        TextNormalizer.normalize
         
-        # 5. Normaliser espaces multiples
-        text = re.sub(r'\s+', ' ', text)
+        Résultats en cache LRU (256 entrées) : une transcription répétée
+        (confirmations) ou un mot-clé déjà vu n'est pas retraité
+    
+    Exemple:
+        >>> normalizer = TextNormalizer()
+        >>> normalizer.normalize("CHOLÉCYSTECTOMIE!")
+        'cholecystectomie'
         
-        # 6. Supprimer espaces avant/après
-        text = text.strip()
+        >>> normalizer.normalize("  Génou   GAUCHE  ,")
+        'genou gauche'
+    """
+    if not text:
+        return ""
+    
+    # 1. Minuscules
+    text = text.lower()
+    
+    if text.isascii():
+        # 2-4. Texte ASCII (transcription Vosk, mots-clés tapés) : aucun
+        #      accent, ponctuation supprimée par bytes.translate
+        text = text.encode('ascii').translate(None, _ASCII_DELETE).decode('ascii')
+    else:
+        # 2-4. Accents, apostrophes et ponctuation : une seule table translate
+        text = text.translate(_NORMALIZE_TABLE)
         
-        return text
+        # 3bis. Accents absents de la table : repli NFD
+        if not text.isascii():
+            text = _strip_marks(text)
+    
+    # 5-6. Espaces : split()/join en C (même définition d'espace que \s,
+    #      et supprime aussi ceux avant/après) -> plus aucune passe regex
+    return " ".join(text.split())
+
+
+class TextNormalizer:
+    """
+    Normalise le texte pour comparaison et analyse
+    """
+    
+    # Constantes du module, exposées sur la classe (API inchangée)
+    ACCENTS_MAP = ACCENTS_MAP
+    PUNCTUATION = PUNCTUATION
+    APOSTROPHES = APOSTROPHES
+    _ACCENTS_TABLE = _ACCENTS_TABLE
+    _NORMALIZE_TABLE = _NORMALIZE_TABLE
+    
+    # Fonction module, sans enveloppe supplémentaire
+    normalize = staticmethod(normalize)
     
     @staticmethod
     def _remove_accents(text):
@@ -97,15 +179,11 @@ class TextNormalizer:
         Returns:
             str: Texte sans accents
         
-        Utilise mapping manuel pour fiabilité
+        Utilise mapping manuel pour fiabilité (table str.translate),
+        puis repli NFD pour les accents absents du mapping
         """
-        result = ""
-        for char in text:
-            if char in TextNormalizer.ACCENTS_MAP:
-                result += TextNormalizer.ACCENTS_MAP[char]
-            else:
-                result += char
-        return result
+        text = text.translate(_ACCENTS_TABLE)
+        return text if text.isascii() else _strip_marks(text)
     
     @staticmethod
     def remove_accents_only(text):
@@ -124,14 +202,14 @@ class TextNormalizer:
         """Supprimer ponctuation"""
         if not text:
             return ""
-        return re.sub(TextNormalizer.PUNCTUATION, '', text)
+        return text.translate(_PUNCT_TABLE)
     
     @staticmethod
     def normalize_spaces(text):
         """Normaliser espaces multiples en un seul"""
         if not text:
             return ""
-        return re.sub(r'\s+', ' ', text).strip()
+        return " ".join(text.split())
     
     @staticmethod
     def split_words(text):
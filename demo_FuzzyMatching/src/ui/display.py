@@ -9,11 +9,32 @@ Module pour afficher dans la console :
 - Couleurs et formatage
 """
 
+import functools
 import os
 import sys
 from typing import List, Optional
 
 
+# Effacement écran décidé une fois : séquence ANSI hors Windows (celle émise
+# par `clear` : curseur en haut, écran et historique effacés), sans lancer
+# de sous-processus ; None -> commande cls
+_CLEAR_SEQ = "\x1b[H\x1b[2J\x1b[3J" if os.name != 'nt' else None
+
+
+@functools.lru_cache(maxsize=8)
+def _progress_bars(width):
+    """
+    Toutes les barres de progression possibles pour une largeur
+    
+    Args:
+        width (int): Largeur barre
+    
+    Returns:
+        tuple: width + 1 barres, indexées par le nombre de cases remplies
+    """
+    return tuple('█' * filled + '░' * (width - filled) for filled in range(width + 1))
+
+
 class Display:
     """
     Gère l'affichage dans la console
@@ -53,7 +74,10 @@ class Display:
     @staticmethod
     def clear_screen():
         """Effacer l'écran"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if _CLEAR_SEQ:
+            sys.stdout.write(_CLEAR_SEQ)
+        else:
+            os.system('cls')
     
     @staticmethod
     def print_banner(title: str, subtitle: str = "", width: int = 60):
@@ -66,11 +90,9 @@ class Display:
             width (int): Largeur (caractères)
         """
         Display.clear_screen()
-        print("\n" + "="*width)
-        print(f"  {title.center(width-4)}")
-        if subtitle:
-            print(f"  {subtitle.center(width-4)}")
-        print("="*width + "\n")
+        sep = "=" * width
+        subtitle_line = f"  {subtitle.center(width-4)}\n" if subtitle else ""
+        sys.stdout.write(f"\n{sep}\n  {title.center(width-4)}\n{subtitle_line}{sep}\n\n")
     
     @staticmethod
     def print_box(text: str, title: str = "", width: int = 60):
@@ -82,12 +104,9 @@ class Display:
             title (str): Titre optionnel
             width (int): Largeur
         """
-        print("\n" + "="*width)
-        if title:
-            print(f"  {title}")
-            print("-"*width)
-        print(f"  {text}")
-        print("="*width + "\n")
+        sep = "=" * width
+        title_lines = f"  {title}\n{'-' * width}\n" if title else ""
+        sys.stdout.write(f"\n{sep}\n{title_lines}  {text}\n{sep}\n\n")
     
     @staticmethod
     def print_section(title: str, width: int = 60):
@@ -98,9 +117,8 @@ class Display:
             title (str): Titre section
             width (int): Largeur
         """
-        print("\n" + "="*width)
-        print(f"  {title}")
-        print("="*width + "\n")
+        sep = "=" * width
+        sys.stdout.write(f"\n{sep}\n  {title}\n{sep}\n\n")
     
     @staticmethod
     def print_list(items: List[str], title: str = "", bullet: str = "•"):
@@ -115,9 +133,7 @@ class Display:
         if title:
             Display.print_section(title)
         
-        for item in items:
-            print(f"  {bullet} {item}")
-        print()
+        sys.stdout.write("".join(f"  {bullet} {item}\n" for item in items) + "\n")
     
     @staticmethod
     def print_table(headers: List[str], rows: List[List[str]], width: int = 60):
@@ -131,41 +147,46 @@ class Display:
         """
         col_width = (width - 4) // len(headers)
         
+        # Format de ligne construit une fois (alignement fait par str.format)
+        cell_fmt = f"{{!s:<{col_width}}}"
+        row_fmt = "  " + " | ".join([cell_fmt] * len(headers))
+        
         # Header
-        header_row = " | ".join(h.ljust(col_width) for h in headers)
-        print(f"  {header_row}")
-        print("  " + "-" * (len(header_row)))
+        header_row = row_fmt.format(*headers)
+        lines = [header_row, "  " + "-" * (len(header_row) - 2)]
         
-        # Rows
+        # Rows (ligne de longueur différente : format construit pour elle)
         for row in rows:
-            row_str = " | ".join(str(cell).ljust(col_width) for cell in row)
-            print(f"  {row_str}")
-        print()
+            fmt = row_fmt if len(row) == len(headers) else "  " + " | ".join([cell_fmt] * len(row))
+            lines.append(fmt.format(*row))
+        
+        # Un seul print pour tout le tableau
+        print("\n".join(lines) + "\n")
     
     @staticmethod
     def print_success(message: str):
         """Afficher message succès"""
-        print(f"  {Display.CHARS['check']} {message}")
+        print(f"  {_CHECK} {message}")
     
     @staticmethod
     def print_error(message: str):
         """Afficher message erreur"""
-        print(f"  {Display.CHARS['cross']} {message}")
+        print(f"  {_CROSS} {message}")
     
     @staticmethod
     def print_warning(message: str):
         """Afficher message avertissement"""
-        print(f"  {Display.CHARS['warning']} {message}")
+        print(f"  {_WARNING} {message}")
     
     @staticmethod
     def print_info(message: str):
         """Afficher message info"""
-        print(f"  {Display.CHARS['info']} {message}")
+        print(f"  {_INFO} {message}")
     
     @staticmethod
     def print_waiting(message: str):
         """Afficher message attente"""
-        print(f"  {Display.CHARS['hourglass']} {message}")
+        print(f"  {_HOURGLASS} {message}")
     
     @staticmethod
     def print_progress_bar(current: int, total: int, width: int = 40):
@@ -183,7 +204,10 @@ class Display:
         """
         percent = (current / total) * 100
         filled = int(width * current / total)
-        bar = '█' * filled + '░' * (width - filled)
+        if 0 <= filled <= width:
+            bar = _progress_bars(width)[filled]
+        else:
+            bar = '█' * filled + '░' * (width - filled)
         
         print(f"  Progress: [{bar}] {percent:.0f}% ({current}/{total})")
     
@@ -197,13 +221,8 @@ class Display:
             question (str): Question
             hint (str): Indice
         """
-        print("\n" + "="*60)
-        print(f"  📋 ITEM {item_id}")
-        print("="*60)
-        print(f"\n  ❓ {question}")
-        if hint:
-            print(f"  💡 {hint}")
-        print()
+        hint_line = f"  💡 {hint}\n" if hint else ""
+        sys.stdout.write(f"\n{_SEP}\n  📋 ITEM {item_id}\n{_SEP}\n\n  ❓ {question}\n{hint_line}\n")
     
     @staticmethod
     def print_recognition_result(recognized: str, status: str, score: int):
@@ -215,14 +234,14 @@ class Display:
             status (str): "VALIDÉ" ou "ÉCHOUÉ"
             score (int): Score (%)
         """
-        icon = Display.CHARS['check'] if "VALIDÉ" in status else Display.CHARS['cross']
-        print("\n" + "="*60)
-        print("  📊 RÉSULTAT")
-        print("="*60)
-        print(f"\n  Reconnu: '{recognized}'")
-        print(f"  Score: {score}%")
-        print(f"\n  {icon} {status}\n")
-        print("="*60 + "\n")
+        icon = _CHECK if "VALIDÉ" in status else _CROSS
+        sys.stdout.write(
+            f"\n{_SEP}\n  📊 RÉSULTAT\n{_SEP}\n"
+            f"\n  Reconnu: '{recognized}'\n"
+            f"  Score: {score}%\n"
+            f"\n  {icon} {status}\n\n"
+            f"{_SEP}\n\n"
+        )
     
     @staticmethod
     def print_summary(valid_count: int, total_count: int, duration: float = None):
@@ -236,15 +255,15 @@ class Display:
         """
         percentage = (valid_count / total_count * 100) if total_count > 0 else 0
         
-        print("\n" + "="*60)
-        print("  📊 RÉSUMÉ FINAL")
-        print("="*60)
-        print(f"\n  Items testés: {total_count}")
-        print(f"  Items validés: {valid_count}")
-        print(f"  Taux de réussite: {percentage:.0f}%")
-        if duration:
-            print(f"  Durée: {duration:.2f}s")
-        print("\n" + "="*60 + "\n")
+        duration_line = f"  Durée: {duration:.2f}s\n" if duration else ""
+        sys.stdout.write(
+            f"\n{_SEP}\n  📊 RÉSUMÉ FINAL\n{_SEP}\n"
+            f"\n  Items testés: {total_count}\n"
+            f"  Items validés: {valid_count}\n"
+            f"  Taux de réussite: {percentage:.0f}%\n"
+            f"{duration_line}"
+            f"\n{_SEP}\n\n"
+        )
     
     @staticmethod
     def ask_confirmation(question: str, default=True) -> bool:
@@ -282,7 +301,7 @@ class Display:
             print(f"  {i}. {choice}")
         
         try:
-            response = int(input(f"\n  {Display.CHARS['arrow']} Votre choix (1-{len(choices)}): "))
+            response = int(input(f"\n  {_ARROW} Votre choix (1-{len(choices)}): "))
             if 1 <= response <= len(choices):
                 return choices[response - 1]
         except ValueError:
@@ -308,6 +327,16 @@ class Display:
         return f"{Display.COLORS[color]}{text}{Display.COLORS['reset']}"
 
 
+# Séparateur des blocs de largeur fixe (print_item, résultat, résumé)
+_SEP = "=" * 60
+
+# Icônes liées une fois au chargement (pas de Display.CHARS[...] par message)
+_CHECK, _CROSS, _WARNING, _INFO, _HOURGLASS, _ARROW = (
+    Display.CHARS[name]
+    for name in ('check', 'cross', 'warning', 'info', 'hourglass', 'arrow')
+)
+
+
 # Exemple d'utilisation
 if __name__ == "__main__":
     print("=== Display Tests ===\n")
@@ -7,10 +7,67 @@ Module pour gérer les menus interactifs :
 - Navigation menus
 """
 
+import sys
 from typing import Optional, Callable, Dict
 from .display import Display
 
 
+# ============================================================================
+# SÉPARATEURS ET ÉCRANS FIXES (construits une fois à l'import)
+# ============================================================================
+
+_SEP = "=" * 60
+_TOP = "\n" + _SEP
+_BOT = _SEP + "\n"
+
+_MAIN_MENU_TEXT = (
+    f"{_TOP}\n"
+    "  📋 MENU PRINCIPAL\n"
+    f"{_SEP}\n"
+    "\n  1️⃣  Exécuter la checklist complète\n"
+    "  2️⃣  Tester un item spécifique\n"
+    "  3️⃣  Changer de patient\n"
+    "  4️⃣  Voir infos patient\n"
+    "  5️⃣  À propos\n"
+    "  0️⃣  QUITTER\n\n"
+)
+
+_SETTINGS_MENU_TEXT = (
+    f"{_TOP}\n"
+    "  ⚙️  PARAMÈTRES\n"
+    f"{_SEP}\n"
+    "\n  1️⃣  Debug mode\n"
+    "  2️⃣  Logging level\n"
+    "  3️⃣  Timeout\n"
+    "  4️⃣  Fuzzy threshold\n"
+    "  0️⃣  Retour\n\n"
+)
+
+_ABOUT_TEXT = f"{_TOP}\n  ℹ️  À PROPOS\n{_SEP}\n" + """
+  VERSION : 2.0
+  
+  Technologie :
+    • Vosk (Reconnaissance vocale offline)
+    • spaCy (Traitement NLP français)
+    • rapidfuzz (Fuzzy matching)
+    • Python 3.7+
+  
+  Fonctionnalités :
+    ✓ Reconnaissance vocale 100% offline
+    ✓ Audio traité uniquement lors des questions
+    ✓ Validation fuzzy matching + NLP avancé
+    ✓ Support vocabulaire médical français
+    ✓ Conforme RGPD - données 100% locales
+    ✓ 9 items checklist chirurgicale
+  
+  Architecture :
+    • Données séparées du code
+    • Configuration centralisée
+    • Code modulaire et testable
+    • Logging complet
+        \n"""
+
+
 class Menus:
     """
     Gère les menus interactifs de l'application
@@ -31,15 +88,7 @@ class Menus:
         """
         Display.clear_screen()
         
-        print("\n" + "="*60)
-        print("  📋 MENU PRINCIPAL")
-        print("="*60)
-        print("\n  1️⃣  Exécuter la checklist complète")
-        print("  2️⃣  Tester un item spécifique")
-        print("  3️⃣  Changer de patient")
-        print("  4️⃣  Voir infos patient")
-        print("  5️⃣  À propos")
-        print("  0️⃣  QUITTER\n")
+        sys.stdout.write(_MAIN_MENU_TEXT)
         
         choice = input("  ➡️  Votre choix (0-5) : ").strip()
         return choice
@@ -61,28 +110,26 @@ class Menus:
         """
         Display.clear_screen()
         
-        print("\n" + "="*60)
-        print("  👤 SÉLECTIONNER PATIENT")
-        print("="*60 + "\n")
-        
-        patient_list = list(patients.items())
-        
-        for idx, (pid, name) in enumerate(patient_list, 1):
-            print(f"  {idx}. {name} ({pid})")
+        # Clés seules (ordre d'insertion), noms lus dans le dict
+        patient_ids = tuple(patients)
         
-        print(f"  0. Annuler\n")
+        lines = "".join(
+            f"  {idx}. {patients[pid]} ({pid})\n"
+            for idx, pid in enumerate(patient_ids, 1)
+        )
+        sys.stdout.write(
+            f"{_TOP}\n  👤 SÉLECTIONNER PATIENT\n{_BOT}\n{lines}  0. Annuler\n\n"
+        )
         
-        try:
-            choice = int(input("  ➡️  Votre choix : "))
-            
-            if choice == 0:
-                return None
-            
-            if 1 <= choice <= len(patient_list):
-                return patient_list[choice - 1][0]
+        # Saisie non numérique écartée sans passer par ValueError
+        # (isdecimal et non isdigit : int() refuse les exposants "²")
+        raw = input("  ➡️  Votre choix : ").strip()
+        if not raw.isdecimal():
+            return None
         
-        except ValueError:
-            pass
+        choice = int(raw)
+        if 1 <= choice <= len(patient_ids):
+            return patient_ids[choice - 1]
         
         return None
     
@@ -99,31 +146,25 @@ class Menus:
         """
         Display.clear_screen()
         
-        print("\n" + "="*60)
-        print("  🔧 TESTER UN ITEM")
-        print("="*60)
-        print("\n  Items disponibles :\n")
-        
-        for item in items:
-            item_id = item.get("id")
-            item_type = item.get("type")
-            question = item.get("question", "?")[:50]
-            
-            print(f"  {item_id}. {item_type:15} - {question}...")
-        
-        print(f"  0. Retour au menu\n")
-        
-        try:
-            choice = int(input("  ➡️  Votre choix : "))
-            
-            if choice == 0:
-                return None
-            
-            if 1 <= choice <= len(items):
-                return choice
-        
-        except ValueError:
-            pass
+        lines = "".join(
+            f"  {item.get('id')}. {item.get('type'):15} - {item.get('question', '?')[:50]}...\n"
+            for item in items
+        )
+        sys.stdout.write(
+            f"{_TOP}\n  🔧 TESTER UN ITEM\n{_SEP}\n"
+            "\n  Items disponibles :\n\n"
+            f"{lines}  0. Retour au menu\n\n"
+        )
+        
+        # Saisie non numérique écartée sans passer par ValueError
+        # (isdecimal et non isdigit : int() refuse les exposants "²")
+        raw = input("  ➡️  Votre choix : ").strip()
+        if not raw.isdecimal():
+            return None
+        
+        choice = int(raw)
+        if 1 <= choice <= len(items):
+            return choice
         
         return None
     
@@ -171,14 +212,7 @@ class Menus:
         """
         Display.clear_screen()
         
-        print("\n" + "="*60)
-        print("  ⚙️  PARAMÈTRES")
-        print("="*60)
-        print("\n  1️⃣  Debug mode")
-        print("  2️⃣  Logging level")
-        print("  3️⃣  Timeout")
-        print("  4️⃣  Fuzzy threshold")
-        print("  0️⃣  Retour\n")
+        sys.stdout.write(_SETTINGS_MENU_TEXT)
         
         choice = input("  ➡️  Votre choix (0-4) : ").strip()
         return choice
@@ -188,33 +222,7 @@ class Menus:
         """Afficher À propos"""
         Display.clear_screen()
         
-        print("\n" + "="*60)
-        print("  ℹ️  À PROPOS")
-        print("="*60)
-        
-        print("""
-  VERSION : 2.0
-  
-  Technologie :
-    • Vosk (Reconnaissance vocale offline)
-    • spaCy (Traitement NLP français)
-    • rapidfuzz (Fuzzy matching)
-    • Python 3.7+
-  
-  Fonctionnalités :
-    ✓ Reconnaissance vocale 100% offline
-    ✓ Micro activé uniquement lors des questions
-    ✓ Validation fuzzy matching + NLP avancé
-    ✓ Support vocabulaire médical français
-    ✓ Conforme RGPD - données 100% locales
-    ✓ 9 items checklist chirurgicale
-  
-  Architecture :
-    • Données séparées du code
-    • Configuration centralisée
-    • Code modulaire et testable
-    • Logging complet
-        """)
+        sys.stdout.write(_ABOUT_TEXT)
         
         Menus.pause_menu()
     
@@ -228,11 +236,7 @@ class Menus:
         """
         Display.clear_screen()
         
-        print("\n" + "="*60)
-        print("  ❌ ERREUR")
-        print("="*60)
-        print(f"\n  {error_message}\n")
-        print("="*60)
+        sys.stdout.write(f"{_TOP}\n  ❌ ERREUR\n{_SEP}\n\n  {error_message}\n\n{_SEP}\n")
         
         Menus.pause_menu()
     
@@ -246,11 +250,7 @@ class Menus:
         """
         Display.clear_screen()
         
-        print("\n" + "="*60)
-        print("  ✅ SUCCÈS")
-        print("="*60)
-        print(f"\n  {message}\n")
-        print("="*60)
+        sys.stdout.write(f"{_TOP}\n  ✅ SUCCÈS\n{_SEP}\n\n  {message}\n\n{_SEP}\n")
         
         Menus.pause_menu()
     
@@ -265,14 +265,8 @@ class Menus:
         """
         Display.clear_screen()
         
-        print("\n" + "="*60)
-        print(f"  ⏳ {title}")
-        print("="*60 + "\n")
-        
-        for step in steps:
-            print(f"  • {step}")
-        
-        print()
+        lines = "".join(f"  • {step}\n" for step in steps)
+        sys.stdout.write(f"{_TOP}\n  ⏳ {title}\n{_BOT}\n{lines}\n")
     
     @staticmethod
     def patient_info_menu(patient: dict):
@@ -284,26 +278,27 @@ class Menus:
         """
         Display.clear_screen()
         
-        print("\n" + "="*60)
-        print("  👤 INFORMATIONS PATIENT")
-        print("="*60)
-        
-        print(f"\n  Identité :")
-        print(f"    Nom : {patient.get('nom', '?')} {patient.get('prenom', '?')}")
-        print(f"    ID : {patient.get('id', '?')}")
-        print(f"    DPI : {patient.get('numero_dpi', '?')}")
-        print(f"    Date naissance : {patient.get('date_naissance', '?')}")
-        
-        operation = patient.get('operation', {})
-        print(f"\n  Intervention :")
-        print(f"    Type : {operation.get('type_intervention', '?')}")
-        print(f"    Site : {operation.get('site_operatoire', '?')}")
-        print(f"    Côté : {operation.get('cote', '?')}")
-        print(f"    Date prévue : {operation.get('date_prevue', '?')}")
-        print(f"    Chirurgien : {operation.get('chirurgien', '?')}")
-        print(f"    Anesthésiste : {operation.get('anesthesiste', '?')}")
-        
-        print("\n" + "="*60)
+        get = patient.get
+        operation = get('operation', {})
+        get_op = operation.get
+        
+        # Écran complet en une seule écriture
+        sys.stdout.write(
+            f"{_TOP}\n  👤 INFORMATIONS PATIENT\n{_SEP}\n"
+            "\n  Identité :\n"
+            f"    Nom : {get('nom', '?')} {get('prenom', '?')}\n"
+            f"    ID : {get('id', '?')}\n"
+            f"    DPI : {get('numero_dpi', '?')}\n"
+            f"    Date naissance : {get('date_naissance', '?')}\n"
+            "\n  Intervention :\n"
+            f"    Type : {get_op('type_intervention', '?')}\n"
+            f"    Site : {get_op('site_operatoire', '?')}\n"
+            f"    Côté : {get_op('cote', '?')}\n"
+            f"    Date prévue : {get_op('date_prevue', '?')}\n"
+            f"    Chirurgien : {get_op('chirurgien', '?')}\n"
+            f"    Anesthésiste : {get_op('anesthesiste', '?')}\n"
+            f"{_TOP}\n"
+        )
         Menus.pause_menu()
 
 
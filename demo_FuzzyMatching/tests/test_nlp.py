@@ -7,7 +7,12 @@ Tests pour :
 - ConceptExtractor
 """
 
+import sys
 import unittest
+from unittest import mock
+from src.nlp import concept_extractor as concept_extractor_module
+from src.nlp import keyword_detector as keyword_detector_module
+from src.nlp import normalizer as normalizer_module
 from src.nlp.normalizer import TextNormalizer
 from src.nlp.keyword_detector import KeywordDetector
 from src.nlp.concept_extractor import ConceptExtractor
@@ -41,11 +46,32 @@ class TestTextNormalizer(unittest.TestCase):
         result = TextNormalizer.normalize("  CHOLÉCYSTECTOMIE, OUI!  ")
         self.assertEqual(result, "cholecystectomie oui")
     
+    def test_normalize_cached(self):
+        """Test cache normalisation (entrée répétée)"""
+        first = TextNormalizer.normalize("Oui, CONFIRMÉ")
+        hits = TextNormalizer.normalize.cache_info().hits
+        second = TextNormalizer().normalize("Oui, CONFIRMÉ")
+        self.assertEqual(first, second)
+        self.assertEqual(TextNormalizer.normalize.cache_info().hits, hits + 1)
+    
     def test_remove_accents_only(self):
         """Test suppression accents uniquement"""
         result = TextNormalizer.remove_accents_only("Café")
         self.assertEqual(result, "Cafe")
     
+    def test_accents_outside_map(self):
+        """Test accents hors mapping (repli NFD)"""
+        self.assertEqual(TextNormalizer.normalize("Señor ĀNA"), "senor ana")
+        self.assertEqual(TextNormalizer.remove_accents_only("Ñandú"), "Nandu")
+        self.assertEqual(TextNormalizer.normalize("cœur"), "cœur")
+    
+    def test_latin_accents_without_nfd(self):
+        """Test lettres latines accentuées traduites sans repli NFD"""
+        with mock.patch.object(normalizer_module, "_strip_marks") as strip_marks:
+            self.assertEqual(TextNormalizer.normalize("Peña ĽÓDŹ ā"), "pena lodz a")
+            self.assertEqual(TextNormalizer.remove_accents_only("Ñandú"), "Nandu")
+        strip_marks.assert_not_called()
+    
     def test_to_lowercase(self):
         """Test minuscules"""
         result = TextNormalizer.to_lowercase("MARIE")
@@ -65,8 +91,10 @@ class TestTextNormalizer(unittest.TestCase):
 class TestKeywordDetector(unittest.TestCase):
     """Tests KeywordDetector"""
     
-    def setUp(self):
-        self.detector = KeywordDetector()
+    @classmethod
+    def setUpClass(cls):
+        """Détecteur construit une fois pour la classe"""
+        cls.detector = KeywordDetector()
     
     def test_detect_single_keyword(self):
         """Test détection simple"""
@@ -133,17 +161,79 @@ class TestKeywordDetector(unittest.TestCase):
             ["oui", "confirmé"]
         )
         self.assertEqual(len(result["found"]), 2)
+    
+    def test_keywords_normalized_once(self):
+        """Test mots-clés normalisés une seule fois (cache)"""
+        first = self.detector._get_keywords_norm(["Oui", "Confirmé"])
+        second = self.detector._get_keywords_norm(["Oui", "Confirmé"])
+        self.assertIs(first, second)
+        self.assertEqual(first, ["oui", "confirme"])
+    
+    def test_detect_without_ahocorasick(self):
+        """Test repli sans pyahocorasick"""
+        with mock.patch.object(keyword_detector_module, "ahocorasick", None):
+            result = self.detector.detect_keywords(
+                "oui et confirmé",
+                ["ok", "confirmé", "oui"]
+            )
+        self.assertEqual(result["found"], ["confirmé", "oui"])
+        self.assertEqual(result["missing"], ["ok"])
+    
+    def test_detect_batch(self):
+        """Test détection groupée (plusieurs textes)"""
+        texts = ["oui confirmé", "", "hypotermie"]
+        keywords = ["oui", "confirmé", "hypothermie"]
+        results = self.detector.detect_keywords_batch(texts, keywords, fuzzy=True)
+        self.assertEqual(
+            results,
+            [self.detector.detect_keywords(t, keywords, fuzzy=True) for t in texts]
+        )
+        self.assertEqual(results[2]["found"], ["hypothermie"])
+    
+    def test_detect_fuzzy(self):
+        """Test détection fuzzy (scores groupés)"""
+        result = self.detector.detect_keywords(
+            "hypotermie et alergie",
+            ["hypothermie", "allergie", "insuline"],
+            fuzzy=True
+        )
+        self.assertEqual(result["found"], ["hypothermie", "allergie"])
+        self.assertEqual(result["missing"], ["insuline"])
+    
+    def test_detect_fuzzy_word_distance(self):
+        """Test détection fuzzy par distance d'édition mot à mot"""
+        detector = KeywordDetector(use_fuzzy=True, scorer=KeywordDetector.WORD_DISTANCE)
+        result = detector.detect_keywords(
+            "hypotermie genou gauch",
+            ["hypothermie", "genou gauche", "ok", "hypo"]
+        )
+        self.assertEqual(result["found"], ["hypothermie", "genou gauche"])
+        self.assertEqual(result["missing"], ["ok", "hypo"])
+    
+    def test_detect_phrases(self):
+        """Test détection phrases (found, missing, text)"""
+        result = self.detector.detect_phrases(
+            "antibioprophylaxie effectuée",
+            ["antibio", "effectuée", "selon protocole"]
+        )
+        self.assertEqual(result["found"], ["antibio", "effectuée"])
+        self.assertEqual(result["missing"], ["selon protocole"])
+        self.assertEqual(result["text"], "antibioprophylaxie effectuée")
 
 
 class TestConceptExtractor(unittest.TestCase):
     """Tests ConceptExtractor"""
     
-    def setUp(self):
-        self.extractor = ConceptExtractor()
-        self.vocab = {
-            "risques": ["hypothermie", "allergie", "infection"],
-            "traitements": ["insuline", "antibiotique"]
-        }
+    # Vocabulaire partagé (lecture seule)
+    vocab = {
+        "risques": ["hypothermie", "allergie", "infection"],
+        "traitements": ["insuline", "antibiotique"]
+    }
+    
+    @classmethod
+    def setUpClass(cls):
+        """Extracteur construit une fois pour la classe"""
+        cls.extractor = ConceptExtractor()
     
     def test_extract_single_concept(self):
         """Test extraction simple"""
@@ -192,6 +282,59 @@ class TestConceptExtractor(unittest.TestCase):
         )
         self.assertEqual(result["count"], 2)
     
+    def test_extract_category_whole_words(self):
+        """Test extraction mots entiers (pas de sous-chaîne)"""
+        terms = ["genou", "genou gauche", "nou", "gauche droit"]
+        result = self.extractor.extract_category(
+            "Génou GAUCHE",
+            terms,
+            whole_words=True
+        )
+        self.assertEqual(result["found"], ["genou", "genou gauche"])
+        
+        result = self.extractor.extract_category("Génou GAUCHE", terms)
+        self.assertIn("nou", result["found"])
+    
+    def test_vocabulary_normalized_once(self):
+        """Test vocabulaire normalisé une seule fois (cache)"""
+        first = self.extractor._get_normalized_terms(self.vocab["risques"])
+        second = self.extractor._get_normalized_terms(self.vocab["risques"])
+        self.assertIs(first, second)
+        
+        nested = {"termes": ["Hypothermie"]}
+        self.assertEqual(
+            self.extractor._get_normalized_terms(nested),
+            [("Hypothermie", "hypothermie")]
+        )
+    
+    def test_categories_interned(self):
+        """Test catégories filtrées et internées"""
+        required = ["risques", "inconnue", "".join(["traite", "ments"])]
+        first = self.extractor._get_categories(self.vocab, required)
+        self.assertEqual(first, ("risques", "traitements"))
+        self.assertIs(first[1], sys.intern("traitements"))
+    
+    def test_categories_follow_vocabulary_changes(self):
+        """Test catégorie ajoutée ou supprimée prise en compte"""
+        vocab = {"risques": ["hypothermie"]}
+        self.assertEqual(self.extractor._get_categories(vocab, None), ("risques",))
+        vocab["traitements"] = ["insuline"]
+        result = self.extractor.extract_concepts("hypothermie insuline", vocab)
+        self.assertEqual(result["score"], 2)
+        del vocab["risques"]
+        result = self.extractor.extract_concepts("hypothermie insuline", vocab, ["risques", "traitements"])
+        self.assertEqual(result["concepts"], {"traitements": ["insuline"]})
+    
+    def test_extract_without_ahocorasick(self):
+        """Test repli sans pyahocorasick"""
+        with mock.patch.object(concept_extractor_module, "ahocorasick", None):
+            result = self.extractor.extract_concepts(
+                "allergie et hypothermie",
+                self.vocab,
+                ["risques"]
+            )
+        self.assertEqual(result["concepts"], {"risques": ["hypothermie", "allergie"]})
+    
     def test_validate_multi_category(self):
         """Test validation multi-catégories"""
         result = self.extractor.validate_multi_category(
@@ -217,11 +360,63 @@ class TestConceptExtractor(unittest.TestCase):
             }
         )
         self.assertFalse(result["valid"])
+    
+    def test_extract_early_stop(self):
+        """Test arrêt anticipé par catégorie"""
+        result = self.extractor.extract_concepts(
+            "hypothermie allergie infection insuline",
+            self.vocab,
+            ["risques", "traitements"],
+            early_stop={"risques": 1}
+        )
+        self.assertEqual(len(result["concepts"]["risques"]), 1)
+        self.assertEqual(result["concepts"]["traitements"], ["insuline"])
+    
+    def test_validate_multi_category_total_above_minima(self):
+        """Test total_min supérieur aux minima : pas d'arrêt anticipé"""
+        result = self.extractor.validate_multi_category(
+            "hypothermie allergie insuline",
+            self.vocab,
+            {
+                "required_categories": ["risques", "traitements"],
+                "min_per_category": {"risques": 1, "traitements": 1},
+                "total_min": 3
+            }
+        )
+        self.assertTrue(result["valid"])
+    
+    def test_validate_multi_category_full_terms(self):
+        """Test concepts et détails complets malgré les minima atteints"""
+        result = self.extractor.validate_multi_category(
+            "hypothermie allergie insuline",
+            self.vocab,
+            {
+                "required_categories": ["risques", "traitements"],
+                "min_per_category": {"risques": 1, "traitements": 1},
+                "total_min": 2
+            }
+        )
+        self.assertTrue(result["valid"])
+        self.assertEqual(result["concepts"]["risques"], ["hypothermie", "allergie"])
+        self.assertEqual(result["analysis"]["details"]["risques"]["found"], 2)
+        self.assertEqual(result["analysis"]["total_found"], 3)
 
 
 class TestNLPIntegration(unittest.TestCase):
     """Tests d'intégration NLP complets"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Détecteur et extracteur partagés par les workflows"""
+        cls.detector = keyword_detector_module.default
+        cls.extractor = concept_extractor_module.default
+    
+    def test_default_instances(self):
+        """Test instances partagées des modules"""
+        self.assertIsInstance(self.detector, KeywordDetector)
+        self.assertFalse(self.detector.use_fuzzy)
+        self.assertIsInstance(self.extractor, ConceptExtractor)
+    
     def test_full_pipeline(self):
         """Test pipeline NLP complet"""
         # Étape 1 : Normalisation
@@ -230,17 +425,15 @@ class TestNLPIntegration(unittest.TestCase):
         self.assertEqual(normalized, "hypothermie allergie")
         
         # Étape 2 : Détection mots-clés
-        detector = KeywordDetector()
-        keywords_result = detector.detect_keywords(
+        keywords_result = self.detector.detect_keywords(
             normalized,
             ["hypothermie", "allergie"]
         )
         self.assertEqual(len(keywords_result["found"]), 2)
         
         # Étape 3 : Extraction concepts
-        extractor = ConceptExtractor()
         vocab = {"risques": ["hypothermie", "allergie"]}
-        concepts_result = extractor.extract_concepts(
+        concepts_result = self.extractor.extract_concepts(
             normalized,
             vocab,
             ["risques"]
@@ -256,16 +449,14 @@ class TestNLPIntegration(unittest.TestCase):
         normalized = TextNormalizer.normalize(recognized)
         
         # Détecter mots-clés
-        detector = KeywordDetector()
-        keywords = detector.detect_keywords(
+        keywords = self.detector.detect_keywords(
             normalized,
             ["risque", "hypothermie", "allergie", "antibiotique"]
         )
         
         # Extraire concepts
-        extractor = ConceptExtractor()
         vocab = {"risques": ["hypothermie", "allergie"]}
-        concepts = extractor.extract_concepts(
+        concepts = self.extractor.extract_concepts(
             normalized,
             vocab,
             ["risques"]
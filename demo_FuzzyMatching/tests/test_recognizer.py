@@ -8,16 +8,21 @@ Tests pour :
 """
 
 import unittest
-import os
 from pathlib import Path
 
 
+# Chemins partagés par les tests (construits une fois)
+_MODEL_PATH_STR = "data/models/vosk-model-small-fr-0.22"
+_MODEL_PATH = Path(_MODEL_PATH_STR)
+_INVALID_MODEL_PATH = Path("/nonexistent/path/to/model")
+
+
 class TestRecognizerInitialization(unittest.TestCase):
     """Tests initialisation Recognizer"""
     
     def test_vosk_model_path_exists(self):
         """Vérifier que chemin modèle Vosk est valide"""
-        model_path = "data/models/vosk-model-small-fr-0.22"
+        model_path = _MODEL_PATH
         
         # Vérifier si chemin existe (peut ne pas exister en test)
         # Ne pas utiliser directement ChecklistRecognizer ici
@@ -55,14 +60,6 @@ class TestRecognizerTimeouts(unittest.TestCase):
         self.assertGreater(max_timeout, min_timeout)
         self.assertGreaterEqual(default_timeout, min_timeout)
         self.assertLessEqual(default_timeout, max_timeout)
-    
-    def test_timeout_reasonable(self):
-        """Vérifier timeouts raisonnables"""
-        timeouts = [5, 10, 15, 20, 30]
-        
-        for timeout in timeouts:
-            self.assertGreater(timeout, 0)
-            self.assertLess(timeout, 60)
 
 
 class TestRecognizerErrorHandling(unittest.TestCase):
@@ -70,10 +67,8 @@ class TestRecognizerErrorHandling(unittest.TestCase):
     
     def test_model_not_found_error(self):
         """Vérifier gestion erreur modèle non trouvé"""
-        invalid_path = "/nonexistent/path/to/model"
-        
         # Le chemin ne devrait pas exister
-        self.assertFalse(os.path.exists(invalid_path))
+        self.assertFalse(_INVALID_MODEL_PATH.exists())
     
     def test_audio_device_errors(self):
         """Vérifier gestion erreurs device audio"""
@@ -84,23 +79,23 @@ class TestRecognizerErrorHandling(unittest.TestCase):
 class TestRecognizerConfiguration(unittest.TestCase):
     """Tests configuration Recognizer"""
     
-    def test_sample_rates_valid(self):
-        """Vérifier sample rates valides"""
-        valid_rates = [8000, 16000, 44100]
-        
-        for rate in valid_rates:
-            self.assertGreater(rate, 0)
-            self.assertLess(rate, 200000)
-    
-    def test_blocksizes_valid(self):
-        """Vérifier blocksizes valides"""
-        valid_sizes = [2048, 4096, 8192, 16384]
+    def test_config_constants(self):
+        """Vérifier sample rates, blocksizes et timeouts valides"""
+        # (nom, valeurs, borne haute exclue)
+        cases = (
+            ("sample_rate", (8000, 16000, 44100), 200000),
+            ("blocksize", (2048, 4096, 8192, 16384), 100000),
+            ("timeout", (5, 10, 15, 20, 30), 60),
+        )
         
-        for size in valid_sizes:
-            self.assertGreater(size, 0)
-            self.assertLess(size, 100000)
-            # Puissance de 2
-            self.assertEqual(size & (size - 1), 0)
+        for name, values, upper in cases:
+            for value in values:
+                with self.subTest(name=name, value=value):
+                    self.assertGreater(value, 0)
+                    self.assertLess(value, upper)
+                    if name == "blocksize":
+                        # Puissance de 2
+                        self.assertEqual(value & (value - 1), 0)
 
 
 class TestRecognizerIntegration(unittest.TestCase):
@@ -123,7 +118,7 @@ class TestRecognizerIntegration(unittest.TestCase):
     
     def test_model_path_structure(self):
         """Vérifier structure chemin modèle"""
-        model_path = "data/models/vosk-model-small-fr-0.22"
+        model_path = _MODEL_PATH_STR
         
         # Vérifier structure
         self.assertIn("data", model_path)
@@ -9,6 +9,8 @@ Tests pour :
 """
 
 import unittest
+from unittest import mock
+from src.core import validator as validator_module
 from src.core.validator import Validator
 
 
@@ -48,6 +50,14 @@ class TestValidatorNormalization(unittest.TestCase):
         """Test normalisation texte vide"""
         result = self.validator.normalize_text("")
         self.assertEqual(result, "")
+    
+    def test_normalize_cached(self):
+        """Test cache normalisation (appel statique)"""
+        first = Validator.normalize_text("Génou GAUCHE")
+        hits = Validator.normalize_text.cache_info().hits
+        second = self.validator.normalize_text("Génou GAUCHE")
+        self.assertEqual(first, second)
+        self.assertEqual(Validator.normalize_text.cache_info().hits, hits + 1)
 
 
 class TestValidatorFuzzyMatch(unittest.TestCase):
@@ -92,6 +102,56 @@ class TestValidatorFuzzyMatch(unittest.TestCase):
         self.assertTrue(result["valid"])
         self.assertEqual(result["best_match"], "genou gauche")
     
+    def test_fuzzy_no_expected_values(self):
+        """Test sans valeur attendue"""
+        result = self.validator.validate_fuzzy_match(
+            "marie dupont",
+            []
+        )
+        self.assertFalse(result["valid"])
+        self.assertEqual(result["score"], 0)
+        self.assertIsNone(result["best_match"])
+    
+    def test_fuzzy_score_matrix(self):
+        """Test matrice de scores (calcul groupé)"""
+        scores = self.validator.score_matrix(
+            ["marie dupont", "GENOU GAUCHE"],
+            ["genou gauche", "marie dupont"]
+        )
+        self.assertEqual(scores.shape, (2, 2))
+        self.assertEqual(scores[0][1], 100)
+        self.assertEqual(scores[1][0], 100)
+        self.assertLess(scores[0][0], 80)
+    
+    def test_fuzzy_batch(self):
+        """Test validation groupée"""
+        results = self.validator.validate_fuzzy_batch(
+            ["marie dupont", "jean martin", ""],
+            ["marie dupont", "genou gauche"]
+        )
+        self.assertEqual([r["valid"] for r in results], [True, False, False])
+        self.assertEqual(results[0]["score"], 100)
+        self.assertEqual(results[0]["best_match"], "marie dupont")
+        self.assertEqual(results[2]["score"], 0)
+    
+    def test_fuzzy_batch_borderline_score(self):
+        """Test score juste sous le seuil : groupé et unitaire concordent"""
+        # "mary dupont" / "marie dupont" : 86.96 %, arrondi à 87
+        validator = Validator(fuzzy_threshold=87)
+        single = validator.validate_fuzzy_match("mary dupont", ["marie dupont"])
+        batch = validator.validate_fuzzy_batch(["mary dupont"], ["marie dupont"])[0]
+        self.assertFalse(single["valid"])
+        self.assertEqual(batch["valid"], single["valid"])
+        self.assertEqual(batch["score"], single["score"])
+        self.assertEqual(batch["status"], single["status"])
+    
+    def test_fuzzy_exact_match_same_as_batch(self):
+        """Test correspondance exacte : score et statut identiques au groupé"""
+        single = self.validator.validate_fuzzy_match("Marie Dupont", ["marie dupont"])
+        batch = self.validator.validate_fuzzy_batch(["Marie Dupont"], ["marie dupont"])[0]
+        self.assertEqual(single, batch)
+        self.assertEqual(single["status"], "✅ VALIDÉ (100.0%)")
+    
     def test_fuzzy_empty_text(self):
         """Test texte vide"""
         result = self.validator.validate_fuzzy_match(
@@ -156,6 +216,26 @@ class TestValidatorKeywordMatch(unittest.TestCase):
             min_keywords=2
         )
         self.assertTrue(result["valid"])
+    
+    def test_keyword_order_preserved(self):
+        """Test ordre des mots-clés trouvés conservé"""
+        result = self.validator.validate_keyword_match(
+            "confirmé oui",
+            ["oui", "non", "confirmé"],
+            min_keywords=2
+        )
+        self.assertEqual(result["found"], ["oui", "confirmé"])
+    
+    def test_keyword_without_ahocorasick(self):
+        """Test repli sans pyahocorasick"""
+        with mock.patch.object(validator_module, "ahocorasick", None):
+            result = self.validator.validate_keyword_match(
+                "oui et confirmé",
+                ["oui", "confirmé", "ok"],
+                min_keywords=2
+            )
+        self.assertTrue(result["valid"])
+        self.assertEqual(result["found"], ["oui", "confirmé"])
 
 
 class TestValidatorConceptDetection(unittest.TestCase):
@@ -214,6 +294,23 @@ class TestValidatorConceptDetection(unittest.TestCase):
         self.assertFalse(result["valid"])
         self.assertEqual(result["score"], 0)
     
+    def test_concept_prepared(self):
+        """Test vocabulaire pré-aplati (prepare_concepts)"""
+        prepared = Validator.prepare_concepts(self.vocab, ["risques", "traitements"])
+        self.assertEqual(len(prepared[0]), 5)
+        result = self.validator.validate_concept_detection(
+            "hypothermie traitement insuline",
+            self.vocab,
+            ["risques", "traitements"],
+            min_count=2,
+            prepared=prepared
+        )
+        self.assertTrue(result["valid"])
+        self.assertEqual(result["concepts"], {
+            "risques": ["hypothermie"],
+            "traitements": ["insuline"]
+        })
+    
     def test_concept_empty_text(self):
         """Test texte vide"""
         result = self.validator.validate_concept_detection(